@@ -2,25 +2,310 @@
 import sys
 # Provides statistical functions for data analysis
 import statistics
+# Provides memory-mapped access to data files
+import mmap
+# Provides access to file sizes
+import os
+# Provides the clock used to time progress lines
+import time
+# Parses the command line options
+import argparse
+# Sums the tallied values exactly for the optional exact final line
+from fractions import Fraction
+# Tallies how many times each distinct value appears
+from collections import Counter
 
-# Initialize an empty list to store valid numeric values
-values = []
 # Assigning missing data value as per the data documentation
 missingData = -9999.0
 
-# Loop through each line of input from the standard input (piped input)
-for line in sys.stdin:
-    value = float(line.strip())
-    # If the value is valid (not equal to missingData), append it to the values list
-    if value != missingData:
-        values.append(value)
-
-# Calculate statistics for the valid numeric values
-if values:
-    minValue = min(values)
-    maxValue = max(values)
-    average = statistics.mean(values)
-    median = statistics.median(values)
-
-# Print computed values as per the format in HW sample
-print(f"min: {minValue:.1f}, max: {maxValue:.1f}, average: {average:.13f}, median: {median:.2f}")
\ No newline at end of file
+
+def read_values(fileName=None):
+    '''
+    The function yields the numeric value on each line of a data source:
+
+    A named file is memory-mapped and each line is parsed straight from the mapped bytes, so no
+    str object is created per line. Without a file name, standard input (piped input) is read line by line.
+
+    Args:
+    fileName (str): Name of the data file, or None for standard input
+
+    returns: generator of values (float)
+    '''
+
+    # Loop through each line of input from the standard input (piped input)
+    if fileName is None:
+        for line in sys.stdin:
+            yield float(line.strip())
+        return
+
+    with open(fileName, 'rb') as file:
+        # Empty files cannot be memory-mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # float() accepts bytes and ignores the surrounding whitespace and newline
+            for line in iter(mapped.readline, b''):
+                yield float(line)
+
+
+class P2Quantile:
+    '''
+    Approximate a single quantile of a stream of values using the P-square algorithm (Jain & Chlamtac).
+
+    Only five marker heights and positions are stored, so the running median of a feed of any length
+    uses constant memory.
+
+    Args:
+    quantile (float): The quantile to estimate, between 0 and 1 (0.5 for the median)
+    '''
+
+    def __init__(self, quantile=0.5):
+        if not 0 < quantile < 1:
+            raise ValueError("Quantile must be between 0 and 1.")
+
+        self.quantile = quantile
+        # The first five values are kept as-is until the markers can be initialized
+        self.heights = []
+        # Actual and desired marker positions, and the desired position increments
+        self.positions = [0, 1, 2, 3, 4]
+        self.desired = [0, 2 * quantile, 4 * quantile, 2 + 2 * quantile, 4]
+        self.increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, value):
+        '''
+        Add a single value to the estimator.
+
+        Args:
+        value (float): The value to add
+        '''
+
+        heights = self.heights
+        # Collect the first five values, then sort them into the initial marker heights
+        if len(heights) < 5:
+            heights.append(value)
+            if len(heights) == 5:
+                heights.sort()
+            return
+
+        # Find the cell the value falls into, extending the outer markers if needed
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        # Shift the positions of the markers above the cell and advance the desired positions
+        for idx in range(cell + 1, 5):
+            self.positions[idx] += 1
+        for idx in range(5):
+            self.desired[idx] += self.increments[idx]
+
+        # Adjust the three middle markers if they drifted too far from their desired positions
+        positions = self.positions
+        for idx in range(1, 4):
+            drift = self.desired[idx] - positions[idx]
+            if (drift >= 1 and positions[idx + 1] - positions[idx] > 1) or \
+                    (drift <= -1 and positions[idx - 1] - positions[idx] < -1):
+                step = 1 if drift > 0 else -1
+                height = self._parabolic(idx, step)
+                if not heights[idx - 1] < height < heights[idx + 1]:
+                    height = self._linear(idx, step)
+                heights[idx] = height
+                positions[idx] += step
+
+    def _parabolic(self, idx, step):
+        '''
+        Piecewise-parabolic prediction of the new height of marker idx.
+        '''
+
+        q, n = self.heights, self.positions
+        return q[idx] + step / (n[idx + 1] - n[idx - 1]) * (
+            (n[idx] - n[idx - 1] + step) * (q[idx + 1] - q[idx]) / (n[idx + 1] - n[idx]) +
+            (n[idx + 1] - n[idx] - step) * (q[idx] - q[idx - 1]) / (n[idx] - n[idx - 1]))
+
+    def _linear(self, idx, step):
+        '''
+        Linear prediction of the new height of marker idx, used when the parabola overshoots.
+        '''
+
+        q, n = self.heights, self.positions
+        return q[idx] + step * (q[idx + step] - q[idx]) / (n[idx + step] - n[idx])
+
+    def value(self):
+        '''
+        Return the current estimate of the quantile.
+
+        returns: estimate (float), or None if no values were added
+        '''
+
+        if not self.heights:
+            return None
+        # With fewer than five values the answer is interpolated exactly from the sorted values
+        if len(self.heights) < 5:
+            ordered = sorted(self.heights)
+            position = self.quantile * (len(ordered) - 1)
+            lowIdx = int(position)
+            highIdx = min(lowIdx + 1, len(ordered) - 1)
+            return ordered[lowIdx] + (ordered[highIdx] - ordered[lowIdx]) * (position - lowIdx)
+        return self.heights[2]
+
+
+class RunningStats:
+    '''
+    Keep running min, max, mean and median of a stream of values without storing the values.
+
+    The mean is updated with Welford's method and the median comes from a P-square sketch, so memory
+    stays constant however long the feed runs. With exact=True a tally of the distinct values is also
+    kept so that the final mean and median are exact; it holds one entry per distinct value, so its
+    memory grows with the number of distinct values seen.
+
+    Args:
+    exact (bool): Keep the tally needed by exact_mean and exact_median
+    '''
+
+    def __init__(self, exact=False):
+        self.count = 0
+        self.mean = 0.0
+        self.minValue = None
+        self.maxValue = None
+        self.sketch = P2Quantile(0.5)
+        self.tally = Counter() if exact else None
+
+    def add(self, value):
+        '''
+        Add a single value to the running statistics.
+
+        Args:
+        value (float): The value to add
+        '''
+
+        self.count += 1
+        # Welford's update keeps the mean accurate without a growing sum
+        self.mean += (value - self.mean) / self.count
+        if self.minValue is None or value < self.minValue:
+            self.minValue = value
+        if self.maxValue is None or value > self.maxValue:
+            self.maxValue = value
+        self.sketch.add(value)
+        if self.tally is not None:
+            self.tally[value] += 1
+
+    def exact_mean(self):
+        '''
+        returns: the mean computed exactly from the tally, like statistics.mean (float)
+        '''
+
+        # The sum of the tallied values is exact, and dividing it rounds once, as statistics.mean does
+        total = sum(Fraction(value) * count for value, count in self.tally.items())
+        return float(total / self.count)
+
+    def exact_median(self):
+        '''
+        Return the exact median by walking the distinct values in order.
+
+        returns: median (float)
+        '''
+
+        # Positions of the two middle values (equal for an odd count)
+        lowIdx = (self.count - 1) // 2
+        highIdx = self.count // 2
+        lowValue = None
+        seen = 0
+        for value in sorted(self.tally):
+            seen += self.tally[value]
+            if lowValue is None and seen > lowIdx:
+                lowValue = value
+            if seen > highIdx:
+                return (lowValue + value) / 2 if lowIdx != highIdx else value
+
+
+def stream_stats(values, every=1000, interval=None, output=None, exact=False):
+    '''
+    The function consumes values one at a time and prints a progress line every few values or seconds,
+    then the stats line once the input ends:
+
+    The final line has the running mean and the sketched median (marked '~'), unless exact is set.
+
+    Args:
+    values (iterable): The values to process; missing values are skipped
+    every (int): Print a progress line after this many valid values (0 to disable)
+    interval (float): Also print a progress line when this many seconds have passed (None to disable)
+    output (file): Where to print the lines (default: standard output)
+    exact (bool): Make the final mean and median exact, at the cost of a tally of the distinct values
+
+    returns: stats (RunningStats)
+    '''
+
+    output = output or sys.stdout
+    stats = RunningStats(exact)
+    lastReport = time.monotonic()
+
+    for value in values:
+        # Skip missing values as per the data documentation
+        if value == missingData:
+            continue
+        stats.add(value)
+
+        # Report on the count, or on the clock if an interval was requested
+        due = every and stats.count % every == 0
+        if interval is not None and not due:
+            due = time.monotonic() - lastReport >= interval
+        if due:
+            print(f"count: {stats.count}, min: {stats.minValue:.1f}, max: {stats.maxValue:.1f}, "
+                  f"average: {stats.mean:.13f}, median: ~{stats.sketch.value():.2f}", file=output, flush=True)
+            lastReport = time.monotonic()
+
+    # Print the final values as per the format in HW sample
+    if stats.count and exact:
+        print(f"min: {stats.minValue:.1f}, max: {stats.maxValue:.1f}, average: {stats.exact_mean():.13f}, "
+              f"median: {stats.exact_median():.2f}", file=output)
+    elif stats.count:
+        print(f"min: {stats.minValue:.1f}, max: {stats.maxValue:.1f}, average: {stats.mean:.13f}, "
+              f"median: ~{stats.sketch.value():.2f}", file=output)
+    else:
+        print("No valid values were found!", file=output)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Compute min, max, average and median of one value per line.")
+    parser.add_argument('fileName', nargs = '?', default = None, help = "Data file to read (default: standard input)")
+    parser.add_argument('--stream', action = 'store_true',
+                        help = "Use constant memory and print progress lines while reading")
+    parser.add_argument('--every', type = int, default = 1000, help = "Progress line every N values in stream mode")
+    parser.add_argument('--interval', type = float, default = None, help = "Progress line every T seconds in stream mode")
+    parser.add_argument('--exact-final', action = 'store_true',
+                        help = "Exact final mean and median in stream mode; keeps a tally with one entry per distinct value")
+    args = parser.parse_args()
+
+    # Read from the data file given on the command line, or from standard input
+    fileName = args.fileName
+
+    if args.stream:
+        stream_stats(read_values(fileName), args.every, args.interval, exact = args.exact_final)
+        return
+
+    # Keep the valid numeric values (not equal to missingData)
+    values = [value for value in read_values(fileName) if value != missingData]
+
+    # Calculate statistics for the valid numeric values
+    if values:
+        minValue = min(values)
+        maxValue = max(values)
+        average = statistics.mean(values)
+        median = statistics.median(values)
+
+        # Print computed values as per the format in HW sample
+        print(f"min: {minValue:.1f}, max: {maxValue:.1f}, average: {average:.13f}, median: {median:.2f}")
+    else:
+        print("No valid values were found!")
+
+
+# Entry point of the program
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+# Import the unittest module for writing and running test cases
+import unittest
+# Import the statistics module to check the exact final line against
+import statistics
+# Import the io and contextlib modules to capture the printed output
+import io
+import contextlib
+# Import the os and tempfile modules to create temporary data files
+import os
+import tempfile
+# Import 'patch' to run main with a given command line and a fake clock
+from unittest.mock import patch
+# Import the streaming statistics from the compute_stats module
+import compute_stats
+from compute_stats import P2Quantile, RunningStats, stream_stats, main
+
+
+# Define a test class for the constant-memory streaming mode
+class TestStreamStats(unittest.TestCase):
+
+    # A short feed with a missing value in the middle
+    values = [3.5, 1.0, -9999.0, 2.5, 4.0, 0.5, 2.0, 6.0]
+
+    # Test that a progress line is printed after every N valid values and the final line at EOF
+    def test_progress_every_n_values(self):
+        output = io.StringIO()
+        stats = stream_stats(self.values, every=3, output=output)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(stats.count, 7)
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith("count: 3, min: 1.0, max: 3.5, average: 2.3333333333333"))
+        self.assertTrue(lines[1].startswith("count: 6, min: 0.5, max: 4.0, "))
+        self.assertTrue(lines[2].startswith("min: 0.5, max: 6.0, average: 2.7857142857143, median: ~"))
+
+    # Test that a progress line is printed whenever the interval has passed on the clock
+    def test_progress_every_interval(self):
+        clock = [0.0]
+
+        # Each value arrives one second after the previous one
+        def feed():
+            for value in self.values:
+                yield value
+                clock[0] += 1
+
+        output = io.StringIO()
+        with patch.object(compute_stats.time, 'monotonic', lambda: clock[0]):
+            stream_stats(feed(), every=0, interval=2.5, output=output)
+        lines = output.getvalue().splitlines()
+        self.assertEqual([line.split(',')[0] for line in lines[:-1]], ["count: 3", "count: 6"])
+        self.assertTrue(lines[-1].startswith("min: 0.5, max: 6.0, "))
+
+    # Test that the opt-in exact final line matches the statistics module
+    def test_exact_final_line(self):
+        valid = [value for value in self.values if value != -9999.0]
+        output = io.StringIO()
+        stats = stream_stats(self.values, every=0, output=output, exact=True)
+        self.assertEqual(output.getvalue(),
+                         f"min: 0.5, max: 6.0, average: {statistics.mean(valid):.13f}, "
+                         f"median: {statistics.median(valid):.2f}\n")
+        self.assertEqual(stats.exact_mean(), statistics.mean(valid))
+        self.assertEqual(stats.exact_median(), statistics.median(valid))
+
+    # Test that only the constant-size state is kept unless the exact final line is requested
+    def test_constant_memory_by_default(self):
+        stats = RunningStats()
+        for value in range(10000):
+            stats.add(value / 7)
+        self.assertIsNone(stats.tally)
+        self.assertEqual(len(stats.sketch.heights), 5)
+        self.assertAlmostEqual(stats.mean, statistics.mean(value / 7 for value in range(10000)))
+        self.assertAlmostEqual(stats.sketch.value(), statistics.median(value / 7 for value in range(10000)),
+                               delta=20)
+
+    # Test that a feed with no valid values is reported
+    def test_no_valid_values(self):
+        output = io.StringIO()
+        self.assertEqual(stream_stats([-9999.0], output=output).count, 0)
+        self.assertEqual(output.getvalue(), "No valid values were found!\n")
+
+    # Test that the sketch interpolates exactly until it has five values
+    def test_p2_quantile(self):
+        sketch = P2Quantile(0.5)
+        self.assertIsNone(sketch.value())
+        for value in (4.0, 1.0, 2.0):
+            sketch.add(value)
+        self.assertEqual(sketch.value(), 2.0)
+        with self.assertRaises(ValueError):
+            P2Quantile(1.5)
+
+    # Test the --stream command line on a small data file
+    def test_stream_command_line(self):
+        handle, fileName = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(handle, 'w') as file:
+            file.write(''.join(f"{value}\n" for value in self.values))
+        try:
+            for options, lineCount in ((['--every', '2'], 4), (['--every', '0', '--exact-final'], 1)):
+                output = io.StringIO()
+                with patch('sys.argv', ['compute_stats.py', fileName, '--stream'] + options), \
+                        contextlib.redirect_stdout(output):
+                    main()
+                lines = output.getvalue().splitlines()
+                self.assertEqual(len(lines), lineCount)
+            # The exact final line of the stream mode matches the default mode
+            plain = io.StringIO()
+            with patch('sys.argv', ['compute_stats.py', fileName]), contextlib.redirect_stdout(plain):
+                main()
+            self.assertEqual(lines[-1], plain.getvalue().strip())
+        finally:
+            os.remove(fileName)
+
+
+# Entry point of the program
+if __name__ == '__main__':
+    # Run the tests when the script is executed directly
+    unittest.main()
@@ -0,0 +1,333 @@
+# Provides access to system-specific parameters and functions
+import sys
+# Provides access to file paths and process information
+import os
+# Import the 'argparse' module to parse the command line options.
+import argparse
+# Import the 'json' module to store and compare benchmark results.
+import json
+# Import the 'time' module for the high resolution timer.
+import time
+# Import the 'datetime' module to build the date column of the synthetic files.
+import datetime
+# Import the 'subprocess' module to run each benchmark case in a fresh process.
+import subprocess
+# Import the 'statistics' module for the reduction of Assignment 1.
+import statistics
+# Import the 'tempfile' module for the default working directory.
+import tempfile
+# Import 'importlib.util' to load compute_stats.py from the Assignment 1 folder.
+import importlib.util
+
+# NumPy and compute_stats2 are imported inside the functions that run in child processes: a forked child
+# starts with the resident set of its parent, so the parent is kept small to keep peak RSS meaningful.
+
+
+# Directory of this script, used to find both assignments
+HERE = os.path.dirname(os.path.abspath(__file__))
+# The column that is benchmarked (T_DAILY_AVG, the column of the Week 1 pipeline)
+COLUMN = 9
+# printf-style format of one record of Data.txt (28 right-aligned fields)
+RECORD_FORMAT = '%5d %8d %6.3f %7.2f %7.2f' + ' %7.1f' * 5 + ' %8.2f %s' + ' %7.1f' * 6 + ' %7.3f' * 5 + ' %7.1f' * 5
+
+
+def generate_data_file(fileName, rows, missingRate=0.02, seed=3006, blockRows=100000):
+    '''
+    The function writes a synthetic data file shaped like Data.txt: the same fixed-width layout, seasonal
+    temperatures, -99.000 soil moisture columns and -9999.0 sentinels in the daily temperature columns.
+
+    Args:
+    fileName (str): Name of the file to write
+    rows (int): Number of records to write
+    missingRate (float): Fraction of the temperature values replaced by the -9999.0 sentinel
+    seed (int): Seed of the random generator, so that files are reproducible
+    blockRows (int): Number of records generated and written at a time
+
+    returns: None
+    '''
+
+    import numpy as np
+    from compute_stats2 import MISSING_VALUES
+
+    rng = np.random.default_rng(seed)
+    # Dates cycle through one year, like the station files
+    firstDay = datetime.date(2018, 1, 1)
+    dates = [int((firstDay + datetime.timedelta(days=day)).strftime('%Y%m%d')) for day in range(365)]
+
+    with open(fileName, 'w') as file:
+        for blockStart in range(0, rows, blockRows):
+            count = min(blockRows, rows - blockStart)
+            dayOfYear = (np.arange(blockStart, blockStart + count) % 365)
+            season = -10 * np.cos(2 * np.pi * dayOfYear / 365)
+            # Daily max, min, mean and average temperatures around the seasonal curve
+            average = np.round(season + 2.5 + rng.normal(0, 4, count), 1)
+            temps = np.column_stack([average + 6, average - 6, average - 0.3, average])
+            temps[rng.random(temps.shape) < missingRate] = MISSING_VALUES[0]
+            precipitation = np.round(rng.exponential(1, count), 1)
+            solar = np.round(rng.uniform(0.5, 31.8, count), 2)
+            surface = np.round(np.column_stack([average + 12, average - 10, average + 1]), 1)
+            humidity = np.round(rng.uniform(5, 95, (count, 3)), 1)
+            soilTemp = np.round(np.column_stack([average - 1, average - 0.5]), 1)
+
+            lines = []
+            for idx in range(count):
+                lines.append(RECORD_FORMAT % (
+                    (94075, dates[dayOfYear[idx]], 2.423, -105.54, 40.04) + tuple(temps[idx]) +
+                    (precipitation[idx], solar[idx], 'C') + tuple(surface[idx]) + tuple(humidity[idx]) +
+                    (-99.0,) * 5 + tuple(soilTemp[idx]) + (-9999.0,) * 3) + '\n')
+            file.writelines(lines)
+
+
+def extract_column_file(dataFile, columnFile, columnNumber=COLUMN):
+    '''
+    The function writes one column of a data file, one value per line, like the `cut -c 63-69` step that
+    feeds compute_stats.py in the Week 1 pipeline:
+
+    Args:
+    dataFile (str): Name of the data file to read
+    columnFile (str): Name of the file to write
+    columnNumber (int): The column to extract
+
+    returns: None
+    '''
+
+    from compute_stats2 import detect_fixed_width
+
+    start, end = detect_fixed_width(dataFile)[columnNumber - 1]
+    with open(dataFile, 'rb') as infile, open(columnFile, 'wb') as outfile:
+        for line in infile:
+            outfile.write(line[start:end] + b'\n')
+
+
+def load_assignment_1():
+    '''
+    The function loads compute_stats.py from the Assignment 1 folder as a module:
+
+    returns: module
+    '''
+
+    spec = importlib.util.spec_from_file_location('compute_stats', os.path.join(HERE, '..', '1', 'compute_stats.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def reduce_assignment_1(values):
+    '''
+    The function computes the same statistics as compute_stats.py does on its list of values:
+
+    Args:
+    values (list): The valid values
+
+    returns: (min, max, average, median)
+    '''
+
+    return (min(values), max(values), statistics.mean(values), statistics.median(values))
+
+
+def run_stage(case, dataFile, columnFile):
+    '''
+    The function runs a single parse or reduce stage in the current process and times only that stage.
+    The input of a reduce stage is prepared before the timer starts.
+
+    Args:
+    case (str): Name of the stage, one of STAGES
+    dataFile (str): Name of the synthetic data file
+    columnFile (str): Name of the one-value-per-line file derived from it
+
+    returns: elapsed time in seconds (float)
+    '''
+
+    from compute_stats2 import compute_stats, iter_column_values, load_column, load_fixed_width_columns, \
+        detect_fixed_width
+
+    spans = detect_fixed_width(dataFile)
+
+    if case == 'stats1-reduce':
+        module = load_assignment_1()
+        values = [value for value in module.read_values(columnFile) if value != module.missingData]
+        stage = lambda: reduce_assignment_1(values)
+    elif case == 'stats1-parse':
+        module = load_assignment_1()
+        stage = lambda: [value for value in module.read_values(columnFile) if value != module.missingData]
+    elif case == 'stats2-stream-parse':
+        stage = lambda: list(iter_column_values(COLUMN, dataFile))
+    elif case == 'stats2-stream-reduce':
+        values = list(iter_column_values(COLUMN, dataFile))
+        stage = lambda: compute_stats(iter(values))
+    elif case == 'stats2-numpy-parse':
+        stage = lambda: load_column(COLUMN, dataFile)
+    elif case == 'stats2-numpy-reduce':
+        values = load_column(COLUMN, dataFile)
+        stage = lambda: compute_stats(values)
+    elif case == 'stats2-fixed-parse':
+        stage = lambda: load_fixed_width_columns([COLUMN], dataFile, spans)
+    else:
+        raise ValueError(f"Unknown stage: {case}")
+
+    start = time.perf_counter()
+    stage()
+    return time.perf_counter() - start
+
+
+# Parse and reduce stages, run in a child process through run_stage
+STAGES = ['stats1-parse', 'stats1-reduce', 'stats2-stream-parse', 'stats2-stream-reduce',
+          'stats2-numpy-parse', 'stats2-numpy-reduce', 'stats2-fixed-parse']
+
+
+def end_to_end_commands(dataFile, columnFile):
+    '''
+    The function returns the command line of every end-to-end case:
+
+    Args:
+    dataFile (str): Name of the synthetic data file
+    columnFile (str): Name of the one-value-per-line file derived from it
+
+    returns: dictionary mapping case names to argument lists
+    '''
+
+    stats1 = os.path.join(HERE, '..', '1', 'compute_stats.py')
+    stats2 = os.path.join(HERE, 'compute_stats2.py')
+    return {
+        'stats1-e2e': [sys.executable, stats1, columnFile],
+        'stats1-stream-e2e': [sys.executable, stats1, columnFile, '--stream', '--every', '0'],
+        'stats2-stream-e2e': [sys.executable, stats2, str(COLUMN), dataFile],
+        'stats2-numpy-e2e': [sys.executable, stats2, str(COLUMN), dataFile, '--engine', 'numpy', '--no-cache'],
+        'stats2-fixed-e2e': [sys.executable, stats2, str(COLUMN), dataFile, '--engine', 'numpy', '--no-cache',
+                             '--fixed-width', 'auto'],
+    }
+
+
+def run_child(command):
+    '''
+    The function runs a command in a child process and measures its wall time and peak resident set size:
+
+    Args:
+    command (list): The command line to run
+
+    returns: (elapsed seconds, peak RSS in KiB, captured standard output)
+    '''
+
+    start = time.perf_counter()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    output = process.stdout.read()
+    # wait4 returns the resource usage of this child only
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode != 0:
+        raise RuntimeError(f"Benchmark command failed: {' '.join(command)}")
+    # ru_maxrss is reported in KiB on Linux
+    return elapsed, usage.ru_maxrss, output
+
+
+def run_benchmarks(rowCounts, workDir, repeat=1):
+    '''
+    The function generates the synthetic files and runs every stage and end-to-end case on them.
+
+    Each case runs in a fresh process, so the peak RSS of one case does not leak into the next. The best
+    of `repeat` runs is kept.
+
+    Args:
+    rowCounts (list): The file sizes to benchmark, in rows
+    workDir (str): Directory where the synthetic files are generated (and reused)
+    repeat (int): Number of runs of each case
+
+    returns: list of result dictionaries
+    '''
+
+    results = []
+    for rows in rowCounts:
+        dataFile = os.path.join(workDir, f"data_{rows}.txt")
+        columnFile = os.path.join(workDir, f"column_{rows}.txt")
+        if not os.path.exists(dataFile):
+            run_child([sys.executable, os.path.abspath(__file__), '--generate', str(rows), dataFile, columnFile])
+
+        commands = {case: [sys.executable, os.path.abspath(__file__), '--stage', case, dataFile, columnFile]
+                    for case in STAGES}
+        commands.update(end_to_end_commands(dataFile, columnFile))
+
+        for case, command in commands.items():
+            best = None
+            for _ in range(repeat):
+                elapsed, peakRss, output = run_child(command)
+                # Stage runs report the time of the stage alone
+                if '--stage' in command:
+                    elapsed = float(output)
+                if best is None or elapsed < best[0]:
+                    best = (elapsed, peakRss)
+            results.append({'case': case, 'rows': rows, 'seconds': round(best[0], 6),
+                            'rowsPerSec': round(rows / best[0]) if best[0] else None, 'peakRssKb': best[1]})
+            print(f"{case:<22} {rows:>11} rows {best[0]:>10.4f} s {results[-1]['rowsPerSec'] or 0:>14,} rows/s "
+                  f"{best[1]:>10,} KiB", flush=True)
+    return results
+
+
+def compare_results(current, baseline, tolerance):
+    '''
+    The function compares two benchmark runs and reports the cases that got slower:
+
+    Args:
+    current (list): Result dictionaries of this run
+    baseline (list): Result dictionaries of an earlier run
+    tolerance (float): Allowed slowdown, for example 0.2 for 20%
+
+    returns: list of (case, rows, ratio) for the regressions
+    '''
+
+    previous = {(result['case'], result['rows']): result['seconds'] for result in baseline}
+    regressions = []
+    for result in current:
+        before = previous.get((result['case'], result['rows']))
+        if before:
+            ratio = result['seconds'] / before
+            print(f"{result['case']:<22} {result['rows']:>11} rows  {ratio:>6.2f}x the baseline time")
+            if ratio > 1 + tolerance:
+                regressions.append((result['case'], result['rows'], ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Benchmark compute_stats.py and compute_stats2.py on synthetic data files.")
+    parser.add_argument('--rows', default = '1e4,1e5,1e6', help = "Comma-separated file sizes in rows, from 1e4 up to 1e8")
+    parser.add_argument('--workdir', default = None, help = "Directory for the generated files (default: a temporary directory)")
+    parser.add_argument('--repeat', type = int, default = 1, help = "Runs per case; the fastest is kept")
+    parser.add_argument('--output', default = 'benchmark_results.json', help = "JSON file to write the results to")
+    parser.add_argument('--compare', default = None, help = "Earlier JSON results to check for regressions")
+    parser.add_argument('--tolerance', type = float, default = 0.2, help = "Allowed slowdown against --compare (0.2 = 20%%)")
+    # Internal: run one stage in this process and print its time
+    parser.add_argument('--stage', nargs = 3, metavar = ('CASE', 'DATA', 'COLUMN'), help = argparse.SUPPRESS)
+    # Internal: generate the data file and its column file in this process
+    parser.add_argument('--generate', nargs = 3, metavar = ('ROWS', 'DATA', 'COLUMN'), help = argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.stage:
+        print(run_stage(*args.stage))
+        return
+    if args.generate:
+        generate_data_file(args.generate[1], int(args.generate[0]))
+        extract_column_file(args.generate[1], args.generate[2])
+        return
+
+    rowCounts = [int(float(part)) for part in args.rows.split(',')]
+    workDir = args.workdir or tempfile.mkdtemp(prefix='compute_stats_bench_')
+    os.makedirs(workDir, exist_ok=True)
+
+    results = run_benchmarks(rowCounts, workDir, args.repeat)
+    with open(args.output, 'w') as file:
+        json.dump({'python': sys.version.split()[0], 'date': datetime.datetime.now().isoformat(timespec='seconds'), 'results': results}, file, indent=2)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as file:
+            regressions = compare_results(results, json.load(file)['results'], args.tolerance)
+        for case, rows, ratio in regressions:
+            print(f"REGRESSION: {case} at {rows} rows is {ratio:.2f}x slower")
+        if regressions:
+            sys.exit(1)
+
+
+# Entry point of the program
+if __name__ == "__main__":
+    # Call the main function to start the program
+    main()
@@ -1,9 +1,35 @@
 # Provides access to system-specific parameters and functions
 import sys
-# Provides statistical functions for data analysis
-import statistics
 # Import the 'csv' module, which provides functionality for working with CSV (Comma-Separated Values) files.
 import csv
+# Import the 'argparse' module to parse the command line options.
+import argparse
+# Import the 'math' module to round percentile positions.
+import math
+# Import the 're' module to find the field boundaries of fixed-width records.
+import re
+# Import the 'os' module to find the size of data files and the number of cores.
+import os
+# Import the 'mmap' module to read data files straight from the page cache.
+import mmap
+# Import the 'json' module to store the cache metadata.
+import json
+# Import the 'shutil' module to remove stale caches.
+import shutil
+# Import 'nullcontext' so standard input can be used like an opened file without closing it.
+from contextlib import nullcontext
+# Import 'Fraction' to sum values exactly, like statistics.mean does.
+from fractions import Fraction
+# Import the 'Counter' class to tally how many times each distinct value appears.
+from collections import Counter
+# Import a process pool to parse chunks of large files in parallel.
+from concurrent.futures import ProcessPoolExecutor
+# Import NumPy for the vectorized column loader and reductions
+import numpy as np
+
+
+# Assigning missing data values as per the data documentation
+MISSING_VALUES = (-9999.0, -99.0)
 
 
 # Replace consecutive spaces with a single space
@@ -15,7 +41,358 @@ def preprocess_line(line):
 
     return ' '.join(line.split())
 
-def compute_stats(values):
+
+def open_source(fileName):
+    '''
+    The function opens a data source for reading bytes:
+
+    Args:
+    fileName (str): The name of the data file, or '-' (or None) for standard input
+
+    returns: context manager giving a binary file object
+    '''
+
+    if fileName is None or fileName == '-':
+        return nullcontext(sys.stdin.buffer)
+    return open(fileName, 'rb')
+
+
+def iter_lines(fileName):
+    '''
+    The function yields the lines of a data source as bytes, without decoding them to str.
+
+    Data files are memory-mapped and each line is sliced out of the mapping, which avoids the
+    decoding and the extra buffer copy of text-mode reading. Standard input cannot be mapped,
+    so it falls back to plain buffered reading.
+
+    Args:
+    fileName (str): The name of the data file, or '-' (or None) for standard input
+
+    returns: generator of lines (bytes)
+    '''
+
+    with open_source(fileName) as file:
+        # Standard input and empty files cannot be memory-mapped
+        if file is sys.stdin.buffer or os.fstat(file.fileno()).st_size == 0:
+            yield from file
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield from iter(mapped.readline, b'')
+
+class P2Quantile:
+    '''
+    Approximate a single quantile of a stream of values using the P-square algorithm (Jain & Chlamtac).
+
+    Only five marker heights and positions are stored, so memory stays constant no matter how many
+    values are added.
+
+    Args:
+    quantile (float): The quantile to estimate, between 0 and 1 (0.5 for the median)
+    '''
+
+    def __init__(self, quantile=0.5):
+        if not 0 < quantile < 1:
+            raise ValueError("Quantile must be between 0 and 1.")
+
+        self.quantile = quantile
+        # The first five values are kept as-is until the markers can be initialized
+        self.heights = []
+        # Actual and desired marker positions, and the desired position increments
+        self.positions = [0, 1, 2, 3, 4]
+        self.desired = [0, 2 * quantile, 4 * quantile, 2 + 2 * quantile, 4]
+        self.increments = [0, quantile / 2, quantile, (1 + quantile) / 2, 1]
+
+    def add(self, value):
+        '''
+        Add a single value to the estimator.
+
+        Args:
+        value (float): The value to add
+        '''
+
+        heights = self.heights
+        # Collect the first five values, then sort them into the initial marker heights
+        if len(heights) < 5:
+            heights.append(value)
+            if len(heights) == 5:
+                heights.sort()
+            return
+
+        # Find the cell the value falls into, extending the outer markers if needed
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = 0
+            while value >= heights[cell + 1]:
+                cell += 1
+
+        # Shift the positions of the markers above the cell and advance the desired positions
+        for idx in range(cell + 1, 5):
+            self.positions[idx] += 1
+        for idx in range(5):
+            self.desired[idx] += self.increments[idx]
+
+        # Adjust the three middle markers if they drifted too far from their desired positions
+        positions = self.positions
+        for idx in range(1, 4):
+            drift = self.desired[idx] - positions[idx]
+            if (drift >= 1 and positions[idx + 1] - positions[idx] > 1) or \
+                    (drift <= -1 and positions[idx - 1] - positions[idx] < -1):
+                step = 1 if drift > 0 else -1
+                height = self._parabolic(idx, step)
+                if not heights[idx - 1] < height < heights[idx + 1]:
+                    height = self._linear(idx, step)
+                heights[idx] = height
+                positions[idx] += step
+
+    def _parabolic(self, idx, step):
+        '''
+        Piecewise-parabolic prediction of the new height of marker idx.
+        '''
+
+        q, n = self.heights, self.positions
+        return q[idx] + step / (n[idx + 1] - n[idx - 1]) * (
+            (n[idx] - n[idx - 1] + step) * (q[idx + 1] - q[idx]) / (n[idx + 1] - n[idx]) +
+            (n[idx + 1] - n[idx] - step) * (q[idx] - q[idx - 1]) / (n[idx] - n[idx - 1]))
+
+    def _linear(self, idx, step):
+        '''
+        Linear prediction of the new height of marker idx, used when the parabola overshoots.
+        '''
+
+        q, n = self.heights, self.positions
+        return q[idx] + step * (q[idx + step] - q[idx]) / (n[idx + step] - n[idx])
+
+    def value(self):
+        '''
+        Return the current estimate of the quantile.
+
+        returns: estimate (float), or None if no values were added
+        '''
+
+        if not self.heights:
+            return None
+        # With fewer than five values the answer is interpolated exactly from the sorted values
+        if len(self.heights) < 5:
+            ordered = sorted(self.heights)
+            position = self.quantile * (len(ordered) - 1)
+            lowIdx = int(position)
+            highIdx = min(lowIdx + 1, len(ordered) - 1)
+            return ordered[lowIdx] + (ordered[highIdx] - ordered[lowIdx]) * (position - lowIdx)
+        return self.heights[2]
+
+
+def add_partial(partials, value):
+    '''
+    The function adds a value to an exact running sum kept as non-overlapping floats (Shewchuk's algorithm,
+    the one behind math.fsum), so no rounding error accumulates:
+
+    Args:
+    partials (list): The partial sums, updated in place
+    value (float): The value to add
+
+    returns: None
+    '''
+
+    idx = 0
+    for partial in partials:
+        if abs(value) < abs(partial):
+            value, partial = partial, value
+        high = value + partial
+        low = partial - (high - value)
+        if low:
+            partials[idx] = low
+            idx += 1
+        value = high
+    partials[idx:] = [value]
+
+
+def exact_mean(values):
+    '''
+    The function computes the mean of a float64 array from its exact sum, so the result is the correctly
+    rounded value that statistics.mean returns, while the work stays vectorized:
+
+    Every value is an integer mantissa times a power of two. The mantissas of each distinct exponent are
+    summed as integers (in blocks small enough not to overflow int64) and the groups are combined exactly.
+
+    Args:
+    values (numpy.ndarray): Non-empty float64 array
+
+    returns: mean (float)
+    '''
+
+    # Infinities and NaNs have no exact sum; they propagate as in an ordinary mean
+    if not np.isfinite(values).all():
+        return float(values.mean())
+
+    mantissas, exponents = np.frexp(values)
+    # Mantissas are below 1 in magnitude, so 53 bits hold them exactly as integers
+    integers = (mantissas * (1 << 53)).astype(np.int64)
+    total = Fraction(0)
+    for exponent in np.unique(exponents).tolist():
+        group = integers[exponents == exponent]
+        # Each block of 1024 values sums to less than 2**63
+        groupSum = sum(np.add.reduceat(group, np.arange(0, group.size, 1024)).tolist())
+        shift = exponent - 53
+        total += groupSum * (1 << shift) if shift >= 0 else Fraction(groupSum, 1 << -shift)
+    return float(total / values.size)
+
+
+class StreamingStats:
+    '''
+    Accumulate min, max, mean and median of a stream of values in a single pass.
+
+    The median is either exact or approximate:
+    - 'exact' keeps a tally of the distinct values seen. Readings in the data files have a fixed
+      number of decimals, so the tally stays small even for very long columns.
+    - 'approx' keeps a P-square sketch that uses constant memory for any kind of data.
+
+    Args:
+    median (str): The median mode, either 'exact' or 'approx'
+    '''
+
+    def __init__(self, median='exact'):
+        if median not in ('exact', 'approx'):
+            raise ValueError("Median mode must be 'exact' or 'approx'.")
+
+        self.mode = median
+        self.count = 0
+        # Non-overlapping partial sums of an exact running total (approximate mode; the tally holds it otherwise)
+        self.partials = [] if median == 'approx' else None
+        self.minValue = None
+        self.maxValue = None
+        # Only the structure for the chosen median mode is created
+        self.tally = Counter() if median == 'exact' else None
+        self.sketch = P2Quantile(0.5) if median == 'approx' else None
+
+    def add(self, value):
+        '''
+        Add a single value to the running statistics.
+
+        Args:
+        value (float): The value to add
+        '''
+
+        self.count += 1
+        if self.minValue is None or value < self.minValue:
+            self.minValue = value
+        if self.maxValue is None or value > self.maxValue:
+            self.maxValue = value
+        if self.tally is not None:
+            self.tally[value] += 1
+        else:
+            self.sketch.add(value)
+            add_partial(self.partials, value)
+
+    def update(self, values):
+        '''
+        Add every value of an iterable to the running statistics.
+
+        Args:
+        values (iterable): The values to add
+        '''
+
+        for value in values:
+            self.add(value)
+
+    def merge(self, other):
+        '''
+        Combine the statistics of another accumulator into this one.
+
+        Only exact-mode accumulators can be merged, because their tallies add up exactly;
+        a P-square sketch cannot be combined with another one.
+
+        Args:
+        other (StreamingStats): The accumulator to merge in
+
+        returns: self (StreamingStats)
+        '''
+
+        if self.tally is None or other.tally is None:
+            raise ValueError("Only exact-mode statistics can be merged.")
+
+        self.count += other.count
+        if other.minValue is not None and (self.minValue is None or other.minValue < self.minValue):
+            self.minValue = other.minValue
+        if other.maxValue is not None and (self.maxValue is None or other.maxValue > self.maxValue):
+            self.maxValue = other.maxValue
+        self.tally.update(other.tally)
+        return self
+
+    def mean(self):
+        '''
+        The total is kept exactly (in the tally, or as partial sums), so the mean is the correctly rounded
+        value that statistics.mean returns.
+
+        returns: the mean of the values added so far (float)
+        '''
+
+        if self.tally is not None:
+            total = sum(Fraction(value) * count for value, count in self.tally.items())
+        else:
+            total = sum(map(Fraction, self.partials))
+        return float(total / self.count)
+
+    def percentile(self, percent):
+        '''
+        Return a percentile of the values added so far.
+
+        In exact mode the distinct values are walked in order until the two order statistics around the
+        percentile position are reached, and they are interpolated like numpy's default 'linear' method.
+        The approximate sketch only tracks the median.
+
+        Args:
+        percent (float): The percentile, between 0 and 100
+
+        returns: percentile (float), or None if no values were added
+        '''
+
+        if self.tally is None:
+            if percent != 50:
+                raise ValueError("The approximate median mode can only compute the median.")
+            return self.sketch.value()
+        if self.count == 0:
+            return None
+
+        position = percentile_position(self.count, percent)
+        lowIdx = math.floor(position)
+        highIdx = math.ceil(position)
+        lowValue = None
+        seen = 0
+        for value in sorted(self.tally):
+            seen += self.tally[value]
+            if lowValue is None and seen > lowIdx:
+                lowValue = value
+            if seen > highIdx:
+                return interpolate(lowValue, value, position - lowIdx)
+
+    def median(self):
+        '''
+        Return the median of the values added so far; for an even count the two middle values are
+        averaged, like statistics.median.
+
+        returns: median (float)
+        '''
+
+        return self.percentile(50)
+
+    def result(self):
+        '''
+        Return the statistics in the same format as compute_stats.
+
+        returns: (Min, Max, Avg, Median), or None if no values were added
+        '''
+
+        if self.count == 0:
+            return None
+        return (round(self.minValue, 1), round(self.maxValue, 1), round(self.mean(), 1), round(self.median(), 1))
+
+
+def compute_stats(values, median='exact'):
     '''
     The function reads values from the specified data source and returns the following computed values as a tuple:
 
@@ -24,24 +401,945 @@ def compute_stats(values):
     Avg: The average of the values
     Median: The middle value
 
+    Other iterables are consumed in a single pass, so a generator such as iter_column_values can be passed in
+    without building the whole column in memory. Lists and NumPy arrays (such as the masked arrays returned
+    by load_column) are reduced with vectorized operations instead, and their median is always exact.
+
     Args:
-    values (list): List of values
+    values (iterable): Iterable of values
+    median (str): 'exact' for an exact median, 'approx' for a constant-memory estimate of a streamed median
 
     returns: (Min, Max, Avg, Median)
     '''
 
+    # Arrays are reduced in C without converting each value to a Python float, and lists that are
+    # already in memory are converted so the median comes from a selection rather than a sort
+    if isinstance(values, np.ndarray):
+        return array_stats(values)
+    if isinstance(values, (list, tuple)):
+        return array_stats(np.asarray(values, dtype=np.float64))
+
     # Calculate statistics for the valid numeric values
-    if values:
-        minValue = min(values)
-        maxValue = max(values)
-        average = statistics.mean(values)
-        median = statistics.median(values)
-
-        # Return computed values as a tuple
-        return (round(minValue, 1), round(maxValue, 1), round(average, 1), round(median, 1))
-    else:
+    stats = StreamingStats(median)
+    stats.update(values)
+
+    # Return computed values as a tuple
+    return stats.result()
+
+
+def percentile_position(count, percent):
+    '''
+    The function returns the (fractional) position of a percentile among count sorted values:
+
+    Args:
+    count (int): The number of values
+    percent (float): The percentile, between 0 and 100
+
+    returns: position (float)
+    '''
+
+    if not 0 <= percent <= 100:
+        raise ValueError("Percentiles must be between 0 and 100.")
+    return (count - 1) * percent / 100
+
+
+def interpolate(lowValue, highValue, fraction):
+    '''
+    The function interpolates between the two order statistics around a percentile position:
+
+    Args:
+    lowValue (float): The value just below the position
+    highValue (float): The value just above the position
+    fraction (float): How far the position is between the two values
+
+    returns: value (float)
+    '''
+
+    # Halfway positions average the two values, exactly like the median of an even count
+    if fraction == 0.5:
+        return (lowValue + highValue) / 2
+    return lowValue + (highValue - lowValue) * fraction
+
+
+def select_percentiles(values, percents):
+    '''
+    The function computes exact percentiles of an array with a single selection pass.
+
+    np.partition (introselect) places every needed order statistic at its sorted position in O(n) on
+    average, without sorting the whole array, so the median and any tail percentiles cost one partition.
+
+    Args:
+    values (numpy.ndarray): Array of values; masked entries of a masked array are ignored
+    percents (list): The percentiles to compute, between 0 and 100 (for example [50, 90, 99])
+
+    returns: list of percentiles (float), or None for each if there are no valid values
+    '''
+
+    if isinstance(values, np.ma.MaskedArray):
+        values = values.compressed()
+    values = np.asarray(values, dtype=np.float64)
+
+    if not percents:
+        return []
+    if values.size == 0:
+        return [None for _ in percents]
+
+    positions = [percentile_position(values.size, percent) for percent in percents]
+    # The two order statistics around every position are selected together
+    kth = sorted({math.floor(position) for position in positions} | {math.ceil(position) for position in positions})
+    partitioned = np.partition(values, kth)
+
+    return [interpolate(float(partitioned[math.floor(position)]), float(partitioned[math.ceil(position)]),
+                        position - math.floor(position)) for position in positions]
+
+
+def array_stats(values):
+    '''
+    The function computes the same tuple as compute_stats for a NumPy array using vectorized reductions:
+
+    Args:
+    values (numpy.ndarray): Array of values; masked entries of a masked array are ignored
+
+    returns: (Min, Max, Avg, Median), or None if there are no valid values
+    '''
+
+    # Keep only the unmasked values as a plain float64 array
+    if isinstance(values, np.ma.MaskedArray):
+        values = values.compressed()
+    values = np.asarray(values, dtype=np.float64)
+
+    if values.size == 0:
         return None
 
+    # The median is selected with a partition rather than a full sort
+    median = select_percentiles(values, [50])[0]
+    return (round(float(values.min()), 1), round(float(values.max()), 1),
+            round(exact_mean(values), 1), round(median, 1))
+
+
+def column_index(columnNumber):
+    '''
+    The function converts a 1-based column number into the index of the field to read from a row:
+
+    Args:
+    columnNumber (int): The column number to process
+
+    returns: index (int)
+    '''
+
+    # Column 12 holds a text flag after whitespace is collapsed, so it maps to the eleventh field
+    return 10 if columnNumber == 12 else columnNumber - 1
+
+
+def parse_columns_chunk(lines, columnIdxs):
+    '''
+    The function parses the requested fields from each line of a chunk into a 2-D float64 array.
+
+    Each line is split only up to the last requested field, and the fields are converted in bulk. If a chunk
+    contains short rows or non-numeric fields, it is parsed again line by line and those entries become NaN.
+
+    Args:
+    lines (list): Lines of the file as bytes
+    columnIdxs (list): Indexes of the fields to read
+
+    returns: values (numpy.ndarray), one row per line and one column per requested field
+    '''
+
+    lastIdx = max(columnIdxs)
+
+    try:
+        # A single field is the common case, so it skips building a list per row
+        if len(columnIdxs) == 1:
+            return np.array([float(line.split(None, lastIdx + 1)[lastIdx]) for line in lines],
+                            dtype=np.float64).reshape(-1, 1)
+        return np.array([[float(fields[idx]) for idx in columnIdxs]
+                         for fields in (line.split(None, lastIdx + 1) for line in lines)],
+                        dtype=np.float64).reshape(-1, len(columnIdxs))
+    except (ValueError, IndexError):
+        pass
+
+    # Slow path for irregular chunks
+    values = np.full((len(lines), len(columnIdxs)), np.nan)
+    for row, line in enumerate(lines):
+        fields = line.split(None, lastIdx + 1)
+        for col, idx in enumerate(columnIdxs):
+            try:
+                values[row, col] = float(fields[idx])
+            except (ValueError, IndexError):
+                pass
+    return values
+
+
+def mask_columns(values, columnNumbers):
+    '''
+    The function masks the missing-value sentinels and unparsed (NaN) entries of parsed columns:
+
+    Args:
+    values (numpy.ndarray): 2-D array with one column per column number
+    columnNumbers (list): The column numbers of the array columns
+
+    returns: dictionary mapping each column number to its values (numpy.ma.MaskedArray)
+    '''
+
+    mask = np.isin(values, MISSING_VALUES) | np.isnan(values)
+    return {columnNumber: np.ma.masked_array(values[:, col], mask=mask[:, col])
+            for col, columnNumber in enumerate(columnNumbers)}
+
+
+def load_columns(columnNumbers, fileName, chunkSize=1 << 24, spans=None):
+    '''
+    The function reads several columns of a whitespace-delimited data file into masked float64 arrays,
+    splitting each line only once.
+
+    The file is read in binary chunks of about chunkSize bytes, so no str object is created per line.
+    Missing-value sentinels, non-numeric fields and short rows are masked. If a fixed-width layout is
+    given, the fields are sliced out of the records instead (see load_fixed_width_columns).
+
+    Args:
+    columnNumbers (list): The column numbers to process
+    fileName (str): The name of the file to read from
+    chunkSize (int): Approximate number of bytes to parse at a time
+    spans (list): Optional (start, end) byte offsets of each field of a fixed-width record
+
+    returns: dictionary mapping each column number to its values (numpy.ma.MaskedArray)
+    '''
+
+    if spans is not None:
+        return load_fixed_width_columns(columnNumbers, fileName, spans, chunkSize)
+
+    columnIdxs = [column_index(columnNumber) for columnNumber in columnNumbers]
+    chunks = []
+
+    try:
+        with open_source(fileName) as file:
+            while True:
+                lines = file.readlines(chunkSize)
+                if not lines:
+                    break
+                chunks.append(parse_columns_chunk(lines, columnIdxs))
+    except FileNotFoundError:
+        print(f"File not found: {fileName}")
+        sys.exit(1)
+
+    values = np.concatenate(chunks) if chunks else np.empty((0, len(columnIdxs)))
+    # Mask the sentinels and anything that could not be parsed
+    return mask_columns(values, columnNumbers)
+
+
+def load_column(columnNumber, fileName, chunkSize=1 << 24):
+    '''
+    The function reads one column of a whitespace-delimited data file into a masked float64 array:
+
+    Args:
+    columnNumber (int): The column number to process
+    fileName (str): The name of the file to read from
+    chunkSize (int): Approximate number of bytes to parse at a time
+
+    returns: values (numpy.ma.MaskedArray)
+    '''
+
+    return load_columns([columnNumber], fileName, chunkSize)[columnNumber]
+
+
+def detect_fixed_width(fileName, sampleLines=100):
+    '''
+    The function checks whether a data file has a fixed-width layout and returns the byte span of each field.
+
+    The first sampleLines non-empty records must all have the same length and their fields must end at the
+    same offsets (fields are right-aligned). Each field then spans from the end of the previous field
+    (including the padding) to its own end.
+
+    Args:
+    fileName (str): The name of the data file
+    sampleLines (int): Number of lines to compare
+
+    returns: list of (start, end) byte offsets, or None if the layout is not fixed-width
+    '''
+
+    # Standard input cannot be sampled and read again
+    if fileName is None or fileName == '-':
+        return None
+
+    layout = None
+    for count, line in enumerate(iter_lines(fileName)):
+        if count == sampleLines:
+            break
+        record = line.rstrip(b'\r\n')
+        if not record.strip():
+            continue
+        current = (len(record), [match.end() for match in re.finditer(rb'\S+', record)])
+        if layout is None:
+            layout = current
+        elif current != layout:
+            return None
+
+    if layout is None:
+        return None
+    ends = layout[1]
+    return list(zip([0] + ends[:-1], ends))
+
+
+def parse_layout(text, fileName):
+    '''
+    The function turns the fixed-width argument into field spans:
+
+    Args:
+    text (str): 'auto' to detect the layout, or comma-separated field widths such as '5,9,7'
+    fileName (str): The name of the data file, used by 'auto'
+
+    returns: list of (start, end) byte offsets, or None if no layout was detected
+    '''
+
+    if text.strip().lower() == 'auto':
+        return detect_fixed_width(fileName)
+
+    widths = [int(part) for part in text.split(',')]
+    if any(width <= 0 for width in widths):
+        raise ValueError("Field widths must be positive.")
+    ends = np.cumsum(widths).tolist()
+    return list(zip([0] + ends[:-1], ends))
+
+
+def field_spans(columnNumbers, spans):
+    '''
+    The function resolves the byte span of each requested column once, before any record is read:
+
+    Args:
+    columnNumbers (list): The column numbers to process
+    spans (list): The (start, end) byte offsets of each field of a record
+
+    returns: list of (start, end) byte offsets; columns beyond the layout get an empty span
+    '''
+
+    fieldSpans = []
+    for columnNumber in columnNumbers:
+        columnIdx = column_index(columnNumber)
+        fieldSpans.append(spans[columnIdx] if columnIdx < len(spans) else (0, 0))
+    return fieldSpans
+
+
+def fixed_width_values(fields):
+    '''
+    The function converts an array of fixed-width byte strings to float64 in one call:
+
+    Args:
+    fields (numpy.ndarray): Array of byte strings (dtype 'S'), possibly padded with spaces
+
+    returns: values (numpy.ndarray); blank or non-numeric fields become NaN
+    '''
+
+    try:
+        return fields.astype(np.float64)
+    except ValueError:
+        pass
+
+    # Slow path for fields holding text or blanks
+    values = np.full(len(fields), np.nan)
+    for idx, field in enumerate(fields):
+        try:
+            values[idx] = float(field)
+        except ValueError:
+            pass
+    return values
+
+
+def slice_fixed_width_records(fileName, fieldSpans):
+    '''
+    The function slices fields out of a memory-mapped file whose records all have the same length.
+
+    The mapping is viewed as a 2-D byte array with one row per record, so each field is a column slice of
+    that array; it is copied and converted in bulk without looking at individual lines.
+
+    Args:
+    fileName (str): The name of the data file
+    fieldSpans (list): The (start, end) byte offsets of the fields to read
+
+    returns: 2-D values array (numpy.ndarray), or None if the records are not all the same length
+    '''
+
+    if fileName is None or fileName == '-':
+        return None
+
+    with open(fileName, 'rb') as file:
+        fileSize = os.fstat(file.fileno()).st_size
+        if fileSize == 0:
+            return np.empty((0, len(fieldSpans)))
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            recordLength = mapped.find(b'\n') + 1
+            if recordLength == 0 or fileSize % recordLength:
+                return None
+
+            # Views of the mapping must be released before it is closed
+            records = np.frombuffer(mapped, np.uint8).reshape(-1, recordLength)
+            try:
+                if not np.all(records[:, -1] == ord('\n')):
+                    return None
+                # Always copy: a slice of a single record is already contiguous and would still point into the mapping
+                fields = [records[:, start:end].copy() for start, end in fieldSpans]
+            finally:
+                del records
+
+    columns = [fixed_width_values(field.view(f'S{field.shape[1]}').ravel()) if field.shape[1]
+               else np.full(field.shape[0], np.nan) for field in fields]
+    return np.column_stack(columns)
+
+
+def load_fixed_width_columns(columnNumbers, fileName, spans, chunkSize=1 << 24):
+    '''
+    The function reads columns of a fixed-width data file into masked float64 arrays by slicing byte offsets.
+
+    No line is split into fields. When every record has the same length, the whole file is sliced as a
+    memory-mapped 2-D array; otherwise the file is read in chunks of lines and each field is sliced per line.
+
+    Args:
+    columnNumbers (list): The column numbers to process
+    fileName (str): The name of the data file, or '-' for standard input
+    spans (list): The (start, end) byte offsets of each field of a record
+    chunkSize (int): Approximate number of bytes to parse at a time in the line-by-line fallback
+
+    returns: dictionary mapping each column number to its values (numpy.ma.MaskedArray)
+    '''
+
+    fieldSpans = field_spans(columnNumbers, spans)
+
+    try:
+        values = slice_fixed_width_records(fileName, fieldSpans)
+        if values is None:
+            chunks = []
+            with open_source(fileName) as file:
+                while True:
+                    lines = file.readlines(chunkSize)
+                    if not lines:
+                        break
+                    chunks.append(np.column_stack([
+                        fixed_width_values(np.array([line[start:end] for line in lines], dtype=f'S{max(end - start, 1)}'))
+                        for start, end in fieldSpans]))
+            values = np.concatenate(chunks) if chunks else np.empty((0, len(fieldSpans)))
+    except FileNotFoundError:
+        print(f"File not found: {fileName}")
+        sys.exit(1)
+
+    # Mask the sentinels and anything that could not be parsed
+    return mask_columns(values, columnNumbers)
+
+
+def iter_fixed_width_values(columnNumber, fileName, spans):
+    '''
+    The function lazily reads values of one column of a fixed-width data file by slicing its byte span:
+
+    Args:
+    columnNumber (int): The column number to process
+    fileName (str): The name of the file to read from, or '-' for standard input
+    spans (list): The (start, end) byte offsets of each field of a record
+
+    returns: generator of the valid values (float)
+    '''
+
+    # Resolve the byte span once, before the per-line loop
+    start, end = field_spans([columnNumber], spans)[0]
+    if start == end:
+        print("Row values exceeds number of columns.")
+        return
+    # Track whether a valid value has been found yet
+    foundValue = False
+
+    try:
+        for line in iter_lines(fileName):
+            try:
+                value = float(line[start:end])
+            except ValueError:
+                continue
+            # If the value is valid (not one of the MISSING_VALUES), yield it
+            if value not in MISSING_VALUES:
+                foundValue = True
+                yield value
+    except FileNotFoundError:
+        print(f"File not found: {fileName}")
+        sys.exit(1)
+
+    if not foundValue:
+        print("Column is made of missing values.")
+
+
+def cache_dir(fileName):
+    '''
+    The function returns the sidecar directory that holds the binary cache of a data file:
+
+    Args:
+    fileName (str): The name of the data file
+
+    returns: directory name (str)
+    '''
+
+    return fileName + '.cache'
+
+
+def load_cache_meta(fileName):
+    '''
+    The function loads the metadata of the cache directory of a data file, if that directory is one of ours:
+
+    Args:
+    fileName (str): The name of the data file
+
+    returns: metadata (dict), or None if there is no readable meta.json with the cache keys
+    '''
+
+    try:
+        with open(os.path.join(cache_dir(fileName), 'meta.json'), 'r') as file:
+            meta = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(meta, dict) or not {'source', 'size', 'mtime', 'fields'} <= meta.keys():
+        return None
+    return meta
+
+
+def clear_cache(fileName):
+    '''
+    The function removes the binary cache of a data file, if there is one.
+
+    A directory with the cache's name but without our meta.json is left alone, since it may hold
+    someone else's files.
+
+    Args:
+    fileName (str): The name of the data file
+
+    returns: True if a cache was removed (bool)
+    '''
+
+    if load_cache_meta(fileName) is None:
+        return False
+    shutil.rmtree(cache_dir(fileName), ignore_errors=True)
+    return True
+
+
+def source_key(fileName, spans=None):
+    '''
+    The function builds the key that a cache must match to be used for a data file:
+
+    Args:
+    fileName (str): The name of the data file
+    spans (list): Optional (start, end) byte offsets of each field of a fixed-width record
+
+    returns: dictionary with the absolute path, size and modification time of the file, and the layout
+             its fields were parsed with ('whitespace' or the fixed-width spans)
+    '''
+
+    status = os.stat(fileName)
+    # Fields sliced at other offsets hold other values, so the layout is part of the key
+    layout = 'whitespace' if spans is None else [list(span) for span in spans]
+    return {'source': os.path.abspath(fileName), 'size': status.st_size, 'mtime': status.st_mtime_ns,
+            'layout': layout}
+
+
+def read_cache_meta(fileName, spans=None):
+    '''
+    The function reads the metadata of the cache of a data file and checks that it is still fresh.
+
+    A cache whose key does not match the current path, size, modification time and layout of the file is stale;
+    it is removed so it gets rebuilt. A directory with the cache's name that is not one of our caches is
+    never touched: a warning is printed and caching is skipped.
+
+    Args:
+    fileName (str): The name of the data file
+    spans (list): Optional (start, end) byte offsets of each field of a fixed-width record
+
+    returns: metadata (dict) with the cached field indexes under 'fields', or None if caching must be skipped
+    '''
+
+    key = source_key(fileName, spans)
+    meta = load_cache_meta(fileName)
+
+    if meta is None:
+        if os.path.exists(cache_dir(fileName)):
+            print(f"Not caching: {cache_dir(fileName)} exists and is not a cache of {fileName}")
+            return None
+        return dict(key, fields=[])
+    if any(meta.get(name) != value for name, value in key.items()):
+        clear_cache(fileName)
+        return dict(key, fields=[])
+    return meta
+
+
+def write_cached_field(directory, columnIdx, values):
+    '''
+    The function writes one parsed field to the cache: the raw float64 values as a .npy file,
+    and the missing-value mask packed into a bitmask.
+
+    Args:
+    directory (str): The cache directory
+    columnIdx (int): Index of the field
+    values (numpy.ma.MaskedArray): The parsed values and their mask
+
+    returns: None
+    '''
+
+    np.save(os.path.join(directory, f"field_{columnIdx}.npy"), np.ma.getdata(values))
+    np.save(os.path.join(directory, f"field_{columnIdx}_mask.npy"), np.packbits(np.ma.getmaskarray(values)))
+
+
+def read_cached_field(directory, columnIdx):
+    '''
+    The function memory-maps one cached field and rebuilds its masked array:
+
+    Args:
+    directory (str): The cache directory
+    columnIdx (int): Index of the field
+
+    returns: values (numpy.ma.MaskedArray)
+    '''
+
+    values = np.load(os.path.join(directory, f"field_{columnIdx}.npy"), mmap_mode='r')
+    bits = np.load(os.path.join(directory, f"field_{columnIdx}_mask.npy"))
+    mask = np.unpackbits(bits, count=len(values)).astype(bool)
+    return np.ma.masked_array(values, mask=mask)
+
+
+def load_columns_cached(columnNumbers, fileName, spans=None):
+    '''
+    The function reads columns of a data file through a sidecar binary cache.
+
+    Fields that are already cached are memory-mapped without parsing any text. The remaining fields are
+    parsed together with load_columns and added to the cache. If the cache cannot be written (for example
+    in a read-only directory), the parsed columns are returned anyway.
+
+    Args:
+    columnNumbers (list): The column numbers to process
+    fileName (str): The name of the data file
+    spans (list): Optional (start, end) byte offsets of each field of a fixed-width record
+
+    returns: dictionary mapping each column number to its values (numpy.ma.MaskedArray)
+    '''
+
+    try:
+        meta = read_cache_meta(fileName, spans)
+    except FileNotFoundError:
+        print(f"File not found: {fileName}")
+        sys.exit(1)
+    if meta is None:
+        return load_columns(columnNumbers, fileName, spans=spans)
+
+    directory = cache_dir(fileName)
+    # Parse the fields that are not cached yet in a single pass over the file
+    missingNumbers = [columnNumber for columnNumber in columnNumbers if column_index(columnNumber) not in meta['fields']]
+    parsed = load_columns(missingNumbers, fileName, spans=spans) if missingNumbers else {}
+
+    try:
+        if parsed:
+            os.makedirs(directory, exist_ok=True)
+            for columnNumber, values in parsed.items():
+                write_cached_field(directory, column_index(columnNumber), values)
+                meta['fields'] = sorted(set(meta['fields']) | {column_index(columnNumber)})
+            # The metadata is replaced last, so an interrupted write never lists a missing field
+            with open(os.path.join(directory, 'meta.json.tmp'), 'w') as file:
+                json.dump(meta, file)
+            os.replace(os.path.join(directory, 'meta.json.tmp'), os.path.join(directory, 'meta.json'))
+    except OSError as error:
+        print(f"Could not write the cache: {error}")
+
+    return {columnNumber: parsed[columnNumber] if columnNumber in parsed
+            else read_cached_field(directory, column_index(columnNumber))
+            for columnNumber in columnNumbers}
+
+
+def count_columns(fileName):
+    '''
+    The function counts the whitespace-separated fields on the first non-empty line of a file:
+
+    Args:
+    fileName (str): The name of the file to read from
+
+    returns: number of columns (int)
+    '''
+
+    try:
+        with open(fileName, 'r') as file:
+            for line in file:
+                rowValues = line.split()
+                if rowValues:
+                    return len(rowValues)
+    except FileNotFoundError:
+        print(f"File not found: {fileName}")
+        sys.exit(1)
+    return 0
+
+
+def accumulate_lines(lines, accumulators):
+    '''
+    The function splits each line once and feeds the requested fields to their accumulators.
+
+    Short rows and non-numeric fields are skipped for the affected columns only. Lines may be str or bytes.
+
+    Args:
+    lines (iterable): The lines to process
+    accumulators (list): Tuples of (column number, field index, StreamingStats)
+
+    returns: None
+    '''
+
+    # Only split each line up to the last field that is needed
+    lastIdx = max(columnIdx for _, columnIdx, _ in accumulators)
+
+    for line in lines:
+        rowValues = line.split(None, lastIdx + 1)
+        for columnNumber, columnIdx, stats in accumulators:
+            try:
+                value = float(rowValues[columnIdx])
+            except (ValueError, IndexError):
+                continue
+            # If the value is valid (not one of the MISSING_VALUES), add it
+            if value not in MISSING_VALUES:
+                stats.add(value)
+
+
+def accumulate_fixed_width_lines(lines, accumulators, spans):
+    '''
+    The function slices the requested fields out of each fixed-width line and feeds them to their accumulators:
+
+    Args:
+    lines (iterable): The lines to process
+    accumulators (list): Tuples of (column number, field index, StreamingStats)
+    spans (list): The (start, end) byte offsets of each field of a record
+
+    returns: None
+    '''
+
+    # Resolve the byte span of each column once, before the per-line loop
+    fieldSpans = [(start, end, stats) for (start, end), (_, _, stats)
+                  in zip(field_spans([columnNumber for columnNumber, _, _ in accumulators], spans), accumulators)]
+
+    for line in lines:
+        for start, end, stats in fieldSpans:
+            try:
+                value = float(line[start:end])
+            except ValueError:
+                continue
+            # If the value is valid (not one of the MISSING_VALUES), add it
+            if value not in MISSING_VALUES:
+                stats.add(value)
+
+
+def multi_column_stats(columnNumbers, fileName, median='exact', spans=None):
+    '''
+    The function computes the statistics of several columns while reading and splitting the file only once.
+
+    Each line is split a single time (or sliced, for a fixed-width layout) and every requested field is
+    fed to its own StreamingStats accumulator.
+
+    Args:
+    columnNumbers (list): The column numbers to process
+    fileName (str): The name of the file to read from, or '-' for standard input
+    median (str): 'exact' for an exact median, 'approx' for a constant-memory estimate
+    spans (list): Optional (start, end) byte offsets of each field of a fixed-width record
+
+    returns: dictionary mapping each column number to (Min, Max, Avg, Median), or None for columns without valid values
+    '''
+
+    # Resolve the field index of each column once, before the per-line loop
+    accumulators = [(columnNumber, column_index(columnNumber), StreamingStats(median)) for columnNumber in columnNumbers]
+
+    try:
+        if spans is None:
+            accumulate_lines(iter_lines(fileName), accumulators)
+        else:
+            accumulate_fixed_width_lines(iter_lines(fileName), accumulators, spans)
+    except FileNotFoundError:
+        print(f"File not found: {fileName}")
+        sys.exit(1)
+
+    return {columnNumber: stats.result() for columnNumber, _, stats in accumulators}
+
+
+def split_byte_ranges(fileName, numChunks):
+    '''
+    The function splits a file into roughly equal byte ranges whose boundaries fall on line starts:
+
+    Args:
+    fileName (str): The name of the file to split
+    numChunks (int): The number of ranges to aim for
+
+    returns: list of (start, end) byte offsets
+    '''
+
+    fileSize = os.path.getsize(fileName)
+    boundaries = [0]
+
+    with open(fileName, 'rb') as file:
+        for chunk in range(1, numChunks):
+            # Jump to the approximate boundary, then move past the end of the line it falls in
+            file.seek(max(fileSize * chunk // numChunks, boundaries[-1]))
+            file.readline()
+            boundaries.append(min(file.tell(), fileSize))
+    boundaries.append(fileSize)
+
+    # Drop empty ranges, which happen when a single line spans several boundaries
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def chunk_stats(fileName, start, end, columnNumbers, blockSize=1 << 22):
+    '''
+    The function computes mergeable exact-mode statistics for the lines in one byte range of a file.
+
+    This runs in a worker process, so it only takes and returns picklable values.
+
+    Args:
+    fileName (str): The name of the file to read from
+    start (int): Byte offset of the first line of the range
+    end (int): Byte offset just past the last line of the range
+    columnNumbers (list): The column numbers to process
+    blockSize (int): Number of bytes to read at a time
+
+    returns: list of StreamingStats, one per column number
+    '''
+
+    accumulators = [(columnNumber, column_index(columnNumber), StreamingStats('exact')) for columnNumber in columnNumbers]
+
+    with open(fileName, 'rb') as file:
+        file.seek(start)
+        remaining = end - start
+        # Holds the partial line at the end of the previous block
+        carry = b''
+        while remaining > 0:
+            block = file.read(min(blockSize, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            lines = (carry + block).split(b'\n')
+            carry = lines.pop()
+            accumulate_lines(lines, accumulators)
+        if carry:
+            accumulate_lines([carry], accumulators)
+
+    return [stats for _, _, stats in accumulators]
+
+
+def parallel_stats(columnNumbers, fileName, workers=None):
+    '''
+    The function accumulates the statistics of several columns by parsing chunks of the file in a process pool.
+
+    The file is split into newline-aligned byte ranges, a few per worker so that uneven chunks balance out.
+    Each worker returns partial counts, sums, extremes and value tallies that the parent merges, so the
+    medians and percentiles are exact.
+
+    Args:
+    columnNumbers (list): The column numbers to process
+    fileName (str): The name of the file to read from
+    workers (int): Number of worker processes, defaults to the number of cores
+
+    returns: list of merged StreamingStats, one per column number
+    '''
+
+    workers = workers or os.cpu_count() or 1
+
+    try:
+        ranges = split_byte_ranges(fileName, workers * 4)
+    except FileNotFoundError:
+        print(f"File not found: {fileName}")
+        sys.exit(1)
+
+    merged = [StreamingStats('exact') for _ in columnNumbers]
+    with ProcessPoolExecutor(max_workers = workers) as executor:
+        futures = [executor.submit(chunk_stats, fileName, start, end, columnNumbers) for start, end in ranges]
+        for future in futures:
+            for total, partial in zip(merged, future.result()):
+                total.merge(partial)
+
+    return merged
+
+
+def parallel_column_stats(columnNumbers, fileName, workers=None):
+    '''
+    The function computes the statistics of several columns in a process pool; the output matches multi_column_stats:
+
+    Args:
+    columnNumbers (list): The column numbers to process
+    fileName (str): The name of the file to read from
+    workers (int): Number of worker processes, defaults to the number of cores
+
+    returns: dictionary mapping each column number to (Min, Max, Avg, Median), or None for columns without valid values
+    '''
+
+    merged = parallel_stats(columnNumbers, fileName, workers)
+    return {columnNumber: stats.result() for columnNumber, stats in zip(columnNumbers, merged)}
+
+
+def parse_column_list(text, fileName):
+    '''
+    The function turns the column argument into a list of column numbers:
+
+    Args:
+    text (str): A single column number, a comma-separated list such as '6,7,9', or 'all'
+    fileName (str): The name of the data file, used to count the columns for 'all'
+
+    returns: column numbers (list of int)
+    '''
+
+    if text.strip().lower() == 'all':
+        return list(range(1, count_columns(fileName) + 1))
+    return [int(part) for part in text.split(',')]
+
+
+def print_stats_table(results):
+    '''
+    The function prints one row of min/max/avg/median per column:
+
+    Args:
+    results (dict): Dictionary mapping each column number to its statistics tuple or None
+
+    returns: None
+    '''
+
+    print(f"{'Column':>6} {'Min':>11} {'Max':>11} {'Avg':>11} {'Median':>11}")
+    for columnNumber, stats in results.items():
+        # Columns without valid numeric values are shown with dashes
+        cells = stats if stats is not None else ('-',) * 4
+        print(f"{columnNumber:>6} " + ' '.join(f"{cell:>11}" for cell in cells))
+
+
+def iter_column_values(columnNumber, fileName):
+    '''
+    The function lazily reads values of one column from the specified data source, one line at a time.
+
+    Each line is split only up to the requested field, and the field is converted from bytes directly.
+
+    Args:
+    columnNumber (int): The column number to process
+    fileName (str): The name of the file to read from, or '-' for standard input
+
+    returns: generator of the valid values (float)
+    '''
+
+    # Resolve the field index once, before the per-line loop
+    columnIdx = column_index(columnNumber)
+    # Track whether a valid value has been found yet
+    foundValue = False
+
+    try:
+        for line in iter_lines(fileName):
+            rowValues = line.split(None, columnIdx + 1)
+            # Skip blank lines
+            if not rowValues:
+                continue
+            if columnIdx < len(rowValues):
+                try:
+                    value = float(rowValues[columnIdx])
+                except ValueError:
+                    continue
+                # If the value is valid (not one of the MISSING_VALUES), yield it
+                if value not in MISSING_VALUES:
+                    foundValue = True
+                    yield value
+            else:
+                print("Row values exceeds number of columns.")
+                break
+    except FileNotFoundError:
+        print(f"File not found: {fileName}")
+        sys.exit(1)
+
+    if not foundValue:
+        print("Column is made of missing values.")
+
 
 def input_processing(columnNumber, dataSource):
     '''
@@ -54,43 +1352,10 @@ def input_processing(columnNumber, dataSource):
     returns: values (List)
     '''
 
-    # Assigning missing data value as per the data documentation
-    missingData = -9999.0 or -99.000 or 'C' or 'U'
-    # Initialize an empty list to store valid numeric values
-    values = []
-
     # Check if data_source is a string (file name) or a file object
     if isinstance(dataSource, str):
-
-        # If it's a string, try to open it as a file
-        try:
-            with open(dataSource, 'r') as file:
-                for line in file:
-                    line = preprocess_line(line)
-                    rowValues = line.split(' ')
-                    if columnNumber <= len(rowValues):
-                        if columnNumber != 12:
-                            value = rowValues[columnNumber - 1]
-                        elif columnNumber == 12:
-                            value = rowValues[10]
-                        else:
-                            print("USAGE: python3 compute_stats2.py <column Number> [Data Source] ")
-                        try:
-                            value = float(value)
-                            # If the value is valid (not equal to missingData), append it to the values list
-                            if value != missingData:
-                                values.append(value)
-                            if values == []:
-                                print("Column is made of missing values.")
-                                break
-                        except ValueError:
-                            pass
-                    else:
-                        print("Row values exceeds number of columns.")
-                        break
-        except FileNotFoundError:
-            print(f"File not found: {dataSource}")
-            sys.exit(1)
+        # If it's a string, read the column from the file
+        values = list(iter_column_values(columnNumber, dataSource))
     else:
         # If data_source is not a string, assume it's a file object
         values = dataSource[columnNumber - 1]
@@ -99,24 +1364,102 @@ def input_processing(columnNumber, dataSource):
 
 
 def main():
-    if len(sys.argv) < 3:
-        print("USAGE: python3 compute_stats2.py <column Number> [Data Source]")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(usage = "python3 compute_stats2.py <column Number | col,col,... | all> [Data Source] [--median {exact,approx}] [--engine {stream,numpy}] [--percentiles P,P,...] [--fixed-width auto|W,W,...] [--no-cache] [--clear-cache] [--workers N]")
+    parser.add_argument('columnNumber', help = "Column number, comma-separated column numbers, or 'all'")
+    parser.add_argument('dataSource', nargs = '?', default = '-', help = "Name of the data file, or '-' for standard input (default)")
+    parser.add_argument('--median', choices = ['exact', 'approx'], default = 'exact',
+                        help = "Exact median, or a constant-memory approximation for very large files")
+    parser.add_argument('--engine', choices = ['stream', 'numpy'], default = 'stream',
+                        help = "Stream values in constant memory, or load the column into a NumPy array in bulk")
+    parser.add_argument('--percentiles', default = '',
+                        help = "Comma-separated percentiles to print for a single column, for example '90,99'")
+    parser.add_argument('--fixed-width', default = None, metavar = 'auto|W,W,...',
+                        help = "Slice fields at fixed byte offsets instead of splitting lines: detect the layout, or give the field widths")
+    parser.add_argument('--no-cache', action = 'store_true',
+                        help = "Do not read or write the binary cache used by the numpy engine")
+    parser.add_argument('--clear-cache', action = 'store_true',
+                        help = "Remove the binary cache of the data file before running")
+    parser.add_argument('--workers', type = int, default = 1,
+                        help = "Parse the file in this many processes (0 for one per core), splitting lines on whitespace with the exact median")
+    args = parser.parse_args()
+
+    # Standard input can only be read once and cannot be split into byte ranges
+    if args.dataSource == '-':
+        if args.columnNumber.strip().lower() == 'all':
+            print("Column 'all' needs a data file.")
+            sys.exit(1)
+        args.workers = 1
+        args.no_cache = True
+
+    if args.clear_cache and args.dataSource != '-':
+        clear_cache(args.dataSource)
+
+    # The numpy engine goes through the binary cache unless it is bypassed
+    loader = load_columns if args.no_cache else load_columns_cached
 
     try:
-        columnNumber = int(sys.argv[1])
+        columnNumbers = parse_column_list(args.columnNumber, args.dataSource)
     except ValueError:
         print("Column number must be an integer and not null.")
         sys.exit(1)
 
-    if len(sys.argv) == 3:
-        dataSource = sys.argv[2]
-    #else:
-        # Use standard input as the default data source
-        #dataSource = sys.stdin
+    # Resolve the fixed-width layout once, before any record is parsed
+    spans = None
+    if args.fixed_width:
+        try:
+            spans = parse_layout(args.fixed_width, args.dataSource)
+        except ValueError:
+            print("Field widths must be positive integers.")
+            sys.exit(1)
+        if spans is None:
+            print("No fixed-width layout was detected; splitting lines on whitespace instead.")
 
-    # Call the compute_stats function to calculate statistics
-    results = compute_stats(input_processing(columnNumber, dataSource))
+    try:
+        percents = [float(part) for part in args.percentiles.split(',') if part.strip()]
+        for percent in percents:
+            percentile_position(1, percent)
+    except ValueError:
+        print("Percentiles must be numbers between 0 and 100.")
+        sys.exit(1)
+    if percents and args.median == 'approx':
+        print("Percentiles need the exact median mode.")
+        sys.exit(1)
+    # The worker processes split lines on whitespace and keep exact tallies
+    if args.workers != 1 and (args.fixed_width or args.engine != 'stream' or args.median != 'exact'):
+        print("--workers cannot be combined with --fixed-width, --engine numpy or --median approx.")
+        sys.exit(1)
+
+    # Several columns are computed from a single read of the file and printed as a table
+    if len(columnNumbers) > 1 or ',' in args.columnNumber:
+        if args.workers != 1:
+            print_stats_table(parallel_column_stats(columnNumbers, args.dataSource, args.workers))
+        elif args.engine == 'numpy':
+            columns = loader(columnNumbers, args.dataSource, spans=spans)
+            print_stats_table({columnNumber: compute_stats(values) for columnNumber, values in columns.items()})
+        else:
+            print_stats_table(multi_column_stats(columnNumbers, args.dataSource, args.median, spans))
+        return
+
+    columnNumber = columnNumbers[0]
+
+    # Calculate statistics, either on the bulk-loaded array or streaming the column from the file.
+    # The percentiles come from the same selection (array) or tally (stream) as the median.
+    if args.workers != 1:
+        stats = parallel_stats([columnNumber], args.dataSource, args.workers)[0]
+        results = stats.result()
+        percentileValues = [stats.percentile(percent) for percent in percents]
+    elif args.engine == 'numpy':
+        values = loader([columnNumber], args.dataSource, spans=spans)[columnNumber]
+        results = compute_stats(values)
+        percentileValues = select_percentiles(values, percents)
+    else:
+        stats = StreamingStats(args.median)
+        if spans is None:
+            stats.update(iter_column_values(columnNumber, args.dataSource))
+        else:
+            stats.update(iter_fixed_width_values(columnNumber, args.dataSource, spans))
+        results = stats.result()
+        percentileValues = [stats.percentile(percent) for percent in percents]
 
     # Check if there are valid results returned by compute_stats
     if results is not None:
@@ -128,6 +1471,9 @@ def main():
         print("Avg:", results[2])
         # Print the median value
         print("Median:", results[3])
+        # Print the requested percentiles
+        for percent, value in zip(percents, percentileValues):
+            print(f"P{percent:g}:", round(value, 1))
     else:
         # Handle the case where no valid results were generated
         print("No results were generated!")
@@ -1,7 +1,24 @@
 # Import the unittest module for writing and running test cases
 import unittest
+# Import the random module to build shuffled test data
+import random
+# Import the os and tempfile modules to create temporary data files
+import os
+import tempfile
+# Import the io and contextlib modules to capture the printed output of main
+import io
+import contextlib
+# Import 'patch' to run main with a given command line
+from unittest.mock import patch
+# Import NumPy to build array inputs
+import numpy as np
 # Import the compute_stats function from compute_stats2 module
-from compute_stats2 import compute_stats
+from compute_stats2 import compute_stats, iter_column_values, load_column, load_columns, multi_column_stats, \
+    parse_column_list, parallel_column_stats, split_byte_ranges, iter_lines, load_columns_cached, cache_dir, \
+    clear_cache, select_percentiles, detect_fixed_width, parse_layout, load_fixed_width_columns, \
+    iter_fixed_width_values, StreamingStats, main
+# Import the data generator of the benchmark harness
+from benchmark_compute_stats import generate_data_file
 
 
 # Define a test class that inherits from unittest.TestCase
@@ -19,6 +36,14 @@ class TestComputeStats(unittest.TestCase):
         result = compute_stats(data)
         self.assertEqual(result, (1.0, 3.0, 2.0, 2.0))
 
+    # Test that the average is rounded from the exact mean, as statistics.mean computes it
+    def test_exact_mean(self):
+        data = [1.8, 23.4, 8.5, -8.7]
+        expected = (-8.7, 23.4, 6.2, 5.2)
+        self.assertEqual(compute_stats(data), expected)
+        self.assertEqual(compute_stats(iter(data)), expected)
+        self.assertEqual(compute_stats(iter(data), median='approx')[:3], expected[:3])
+
     # Test with an empty list (should return None for all values)
     def test_empty_list(self):
         data = []
@@ -31,6 +56,255 @@ class TestComputeStats(unittest.TestCase):
         result = compute_stats(data)
         self.assertEqual(result, (5.0, 5.0, 5.0, 5.0))
 
+    # Test that a generator gives the same result as a list, since the values are consumed in one pass
+    def test_generator_input(self):
+        data = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0]
+        self.assertEqual(compute_stats(value for value in data), compute_stats(data))
+        self.assertEqual(compute_stats(data), (1.0, 9.0, 3.9, 3.5))
+
+    # Test that the approximate median stays close to the exact one on a large shuffled column
+    def test_approx_median(self):
+        data = [value / 10 for value in range(100001)]
+        random.Random(3006).shuffle(data)
+        exact = compute_stats(data)
+        approx = compute_stats(iter(data), median='approx')
+        self.assertEqual(exact[3], 5000.0)
+        self.assertEqual(approx[:3], exact[:3])
+        self.assertAlmostEqual(approx[3], exact[3], delta=50)
+
+    # Test that an unknown median mode is rejected
+    def test_invalid_median_mode(self):
+        with self.assertRaises(ValueError):
+            StreamingStats(median='mode')
+
+    # Test that percentiles from the partition and from the streaming tally match numpy's linear percentiles
+    def test_percentiles(self):
+        data = [round(value, 1) for value in np.random.default_rng(3006).normal(5, 10, 1001)]
+        percents = [0, 25, 50, 90, 99, 100]
+        expected = np.percentile(data, percents).tolist()
+        stats = StreamingStats()
+        stats.update(data)
+        for actual in (select_percentiles(np.array(data), percents), [stats.percentile(percent) for percent in percents]):
+            for value, reference in zip(actual, expected):
+                self.assertAlmostEqual(value, reference)
+        self.assertEqual(select_percentiles(np.array([]), [50]), [None])
+        self.assertEqual(select_percentiles(np.array(data), []), [])
+        with self.assertRaises(ValueError):
+            select_percentiles(np.array(data), [101])
+
+    # Test that merging partial accumulators gives the same result as one accumulator
+    def test_merge(self):
+        data = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0]
+        first, second = StreamingStats(), StreamingStats()
+        first.update(data[:3])
+        second.update(data[3:])
+        self.assertEqual(first.merge(second).result(), compute_stats(data))
+        with self.assertRaises(ValueError):
+            StreamingStats('approx').merge(StreamingStats())
+
+    # Test that NumPy arrays are reduced to the same tuple, ignoring masked entries
+    def test_array_input(self):
+        data = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0]
+        self.assertEqual(compute_stats(np.array(data)), compute_stats(data))
+        masked = np.ma.masked_array(data + [-9999.0], mask=[False] * 8 + [True])
+        self.assertEqual(compute_stats(masked), compute_stats(data))
+        self.assertIsNone(compute_stats(np.ma.masked_array([1.0], mask=[True])))
+
+
+# Define a test class for reading columns from data files
+class TestIterColumnValues(unittest.TestCase):
+
+    # Write a small whitespace-delimited file with a missing value in the second column
+    def setUp(self):
+        handle, self.fileName = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(handle, 'w') as file:
+            file.write("94075 20180101   -0.8   1.5\n")
+            file.write("94075 20180102 -9999.0   2.5\n")
+            file.write("94075 20180103    3.2   3.5\n")
+            file.write("94075 20180104    1.1 -99.000\n")
+
+    def tearDown(self):
+        clear_cache(self.fileName)
+        os.remove(self.fileName)
+
+    # Test that missing values are skipped while streaming the column
+    def test_skips_missing_values(self):
+        self.assertEqual(list(iter_column_values(3, self.fileName)), [-0.8, 3.2, 1.1])
+        self.assertEqual(compute_stats(iter_column_values(4, self.fileName)), (1.5, 3.5, 2.5, 2.5))
+
+    # Test that the memory-mapped reader yields the same byte lines as plain reading, and handles empty files
+    def test_iter_lines(self):
+        with open(self.fileName, 'rb') as file:
+            self.assertEqual(list(iter_lines(self.fileName)), file.readlines())
+        open(self.fileName, 'w').close()
+        self.assertEqual(list(iter_lines(self.fileName)), [])
+
+    # Test that the bulk loader masks both sentinels and matches the streaming reader
+    def test_load_column(self):
+        column = load_column(3, self.fileName)
+        self.assertEqual(column.mask.tolist(), [False, True, False, False])
+        self.assertEqual(column.compressed().tolist(), [-0.8, 3.2, 1.1])
+        for columnNumber in (3, 4):
+            self.assertEqual(compute_stats(load_column(columnNumber, self.fileName)),
+                             compute_stats(iter_column_values(columnNumber, self.fileName)))
+
+    # Test that short rows and non-numeric fields are masked instead of raising
+    def test_load_column_irregular_rows(self):
+        with open(self.fileName, 'a') as file:
+            file.write("\n94075 20180105 C\n")
+        column = load_column(4, self.fileName, chunkSize=16)
+        self.assertEqual(column.compressed().tolist(), [1.5, 2.5, 3.5])
+        self.assertTrue(load_column(3, self.fileName).mask[-1])
+
+    # Test that cached columns are memory-mapped on the next run and match the parsed ones
+    def test_load_columns_cached(self):
+        first = load_columns_cached([3, 4], self.fileName)
+        self.assertTrue(os.path.exists(os.path.join(cache_dir(self.fileName), 'meta.json')))
+        second = load_columns_cached([3, 4], self.fileName)
+        self.assertIsInstance(np.ma.getdata(second[3]), np.memmap)
+        for columnNumber in (3, 4):
+            self.assertEqual(compute_stats(second[columnNumber]), compute_stats(first[columnNumber]))
+            self.assertEqual(second[columnNumber].mask.tolist(), first[columnNumber].mask.tolist())
+
+    # Test that a cache is rebuilt after the data file changes
+    def test_stale_cache_is_rebuilt(self):
+        load_columns_cached([3], self.fileName)
+        with open(self.fileName, 'a') as file:
+            file.write("94075 20180105   9.9   4.5\n")
+        self.assertEqual(compute_stats(load_columns_cached([3], self.fileName)[3])[1], 9.9)
+        self.assertEqual(compute_stats(load_columns_cached([3], self.fileName)[3])[1], 9.9)
+
+    # Test that a directory with the cache's name that is not a cache is never removed
+    def test_foreign_cache_directory_is_kept(self):
+        notes = os.path.join(cache_dir(self.fileName), 'notes.txt')
+        os.makedirs(cache_dir(self.fileName))
+        with open(notes, 'w') as file:
+            file.write("not a cache\n")
+        try:
+            columns = load_columns_cached([3], self.fileName)
+            self.assertEqual(compute_stats(columns[3]), compute_stats(load_column(3, self.fileName)))
+            self.assertFalse(clear_cache(self.fileName))
+            self.assertEqual(os.listdir(cache_dir(self.fileName)), ['notes.txt'])
+        finally:
+            os.remove(notes)
+            os.rmdir(cache_dir(self.fileName))
+
+    # Test that one pass over several columns matches computing each column separately
+    def test_multi_column_stats(self):
+        columnNumbers = parse_column_list('all', self.fileName)
+        self.assertEqual(columnNumbers, [1, 2, 3, 4])
+        results = multi_column_stats(columnNumbers, self.fileName)
+        columns = load_columns(columnNumbers, self.fileName)
+        for columnNumber in columnNumbers:
+            self.assertEqual(results[columnNumber], compute_stats(iter_column_values(columnNumber, self.fileName)))
+            self.assertEqual(compute_stats(columns[columnNumber]), results[columnNumber])
+        self.assertEqual(parse_column_list('3,4', self.fileName), [3, 4])
+
+    # Test that the byte ranges cover the whole file and start on line boundaries
+    def test_split_byte_ranges(self):
+        with open(self.fileName, 'rb') as file:
+            data = file.read()
+        ranges = split_byte_ranges(self.fileName, 3)
+        self.assertEqual(b''.join(data[start:end] for start, end in ranges), data)
+        self.assertTrue(all(start == 0 or data[start - 1:start] == b'\n' for start, _ in ranges))
+
+    # Test that merging the partial results of the worker processes matches the serial result
+    def test_parallel_column_stats(self):
+        self.assertEqual(parallel_column_stats([3, 4], self.fileName, workers=2),
+                         multi_column_stats([3, 4], self.fileName))
+
+    # Test that the options the worker processes do not support are rejected instead of ignored
+    def test_workers_reject_unsupported_options(self):
+        for options in (['--fixed-width', 'auto'], ['--engine', 'numpy'], ['--median', 'approx']):
+            output = io.StringIO()
+            with patch('sys.argv', ['compute_stats2.py', '3', self.fileName, '--workers', '2'] + options), \
+                    contextlib.redirect_stdout(output), self.assertRaises(SystemExit) as raised:
+                main()
+            self.assertEqual(raised.exception.code, 1)
+            self.assertIn("--workers cannot be combined", output.getvalue())
+
+
+# Define a test class for the fixed-width fast path
+class TestFixedWidth(unittest.TestCase):
+
+    # Write a small fixed-width file with right-aligned fields, a text flag and both sentinels
+    def setUp(self):
+        handle, self.fileName = tempfile.mkstemp(suffix='.txt')
+        with os.fdopen(handle, 'w') as file:
+            file.write("94075 20180101    -0.8 C     1.5\n")
+            file.write("94075 20180102 -9999.0 C     2.5\n")
+            file.write("94075 20180103     3.2 U -99.000\n")
+
+    def tearDown(self):
+        os.remove(self.fileName)
+
+    # Test that the field spans are detected from the right-aligned layout
+    def test_detect_fixed_width(self):
+        self.assertEqual(detect_fixed_width(self.fileName), [(0, 5), (5, 14), (14, 22), (22, 24), (24, 32)])
+        self.assertEqual(parse_layout('5,9,8,2,8', self.fileName), detect_fixed_width(self.fileName))
+
+    # Test that slicing the fields gives the same values as splitting the lines
+    def test_fixed_width_matches_split(self):
+        spans = detect_fixed_width(self.fileName)
+        columns = load_fixed_width_columns([3, 4, 5], self.fileName, spans)
+        self.assertEqual(columns[3].compressed().tolist(), [-0.8, 3.2])
+        self.assertTrue(columns[4].mask.all())
+        for columnNumber in (3, 5):
+            self.assertEqual(list(iter_fixed_width_values(columnNumber, self.fileName, spans)),
+                             list(iter_column_values(columnNumber, self.fileName)))
+            self.assertEqual(compute_stats(columns[columnNumber]),
+                             compute_stats(load_column(columnNumber, self.fileName)))
+
+    # Test that a single record is sliced into copies, so the mapping can be closed
+    def test_single_record(self):
+        with open(self.fileName, 'w') as file:
+            file.write("94075 20180101    -0.8 C     1.5\n")
+        columns = load_fixed_width_columns([3], self.fileName, detect_fixed_width(self.fileName))
+        self.assertEqual(columns[3].compressed().tolist(), [-0.8])
+
+    # Test that fields cached with one layout are not reused for another
+    def test_cache_keeps_layouts_apart(self):
+        try:
+            sliced = load_columns_cached([3], self.fileName, spans=[(0, 3), (3, 6), (6, 9)])
+            split = load_columns_cached([3], self.fileName)
+            self.assertEqual(compute_stats(split[3]), compute_stats(load_column(3, self.fileName)))
+            self.assertNotEqual(compute_stats(sliced[3]), compute_stats(split[3]))
+        finally:
+            clear_cache(self.fileName)
+
+    # Test that records of different lengths fall back to slicing line by line
+    def test_irregular_records(self):
+        spans = detect_fixed_width(self.fileName)
+        with open(self.fileName, 'a') as file:
+            file.write("94075 20180104     4.4\n")
+        self.assertIsNone(detect_fixed_width(self.fileName))
+        columns = load_fixed_width_columns([3, 5], self.fileName, spans)
+        self.assertEqual(columns[3].compressed().tolist(), [-0.8, 3.2, 4.4])
+        self.assertEqual(columns[5].compressed().tolist(), [1.5, 2.5])
+
+
+# Define a test class for the synthetic data files of the benchmark harness
+class TestBenchmarkData(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.fileName = tempfile.mkstemp(suffix='.txt')
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.fileName)
+
+    # Test that generated files have the Data.txt layout and sentinels that are masked
+    def test_generated_file_layout(self):
+        generate_data_file(self.fileName, 500, missingRate=0.1, blockRows=128)
+        with open(self.fileName, 'r') as file:
+            lines = file.readlines()
+        self.assertEqual(len(lines), 500)
+        self.assertTrue(all(len(line) == 217 and len(line.split()) == 28 for line in lines))
+        self.assertEqual(len(detect_fixed_width(self.fileName)), 28)
+        column = load_column(9, self.fileName)
+        self.assertTrue(0 < column.mask.sum() < 500)
+        self.assertEqual(column.compressed().tolist(), list(iter_column_values(9, self.fileName)))
+
 
 # Entry point of the program
 if __name__ == '__main__':
@@ -1,12 +1,131 @@
 ### START:
 # Import the 'csv' module to enable functionality related to CSV files.
 import csv
+# Import the 'math' module to count the time steps.
+import math
+# Import NumPy to compute whole trajectories without a Python loop.
+import numpy as np
+# Import ProcessPoolExecutor to spread parameter sweeps across processes.
+from concurrent.futures import ProcessPoolExecutor
+# Import 'deque' to track the sweep chunks in flight.
+from collections import deque
+# Import the 'gzip' and 'os' modules for the compressed and columnar output formats.
+import gzip
+import os
+# zstandard is optional; '.zst' output is only available when it is installed.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Relative tolerance of the step count; a single division is off by far less than this.
+STEP_TOLERANCE = 1e-12
+# Relative tolerance of the last time point, a few rounding errors of the product i*d_t.
+TIME_TOLERANCE = 4 * np.finfo(float).eps
+
+
+def step_count(d_t, t_end):
+    """
+    Count the time points of a simulation from t=0 to t_end inclusive.
+
+    The count is computed once from the ratio t_end / d_t, with a small relative tolerance so that a t_end
+    lying on the grid (for example 2 with steps of 0.1, or 1000 with steps of 1e-5) is always included.
+    The tolerance is capped at half a step, and a last point that lands past t_end is dropped again,
+    so very fine grids do not gain an extra step either.
+    Times are then taken as i*d_t rather than accumulated, so the count never depends on rounding drift.
+
+    Parameters:
+    - d_t (float): Incremental time step for the simulation.
+    - t_end (float): Final time to stop the simulation.
+
+    Returns:
+    - int: Number of time points.
+    """
+
+    # A non-positive step would never reach the end time.
+    if d_t <= 0:
+        raise ValueError("Time step must be positive.")
+    # A negative end time leaves no time points at all.
+    if t_end < 0:
+        return 0
+    # Round the ratio down, forgiving the rounding error of values such as 2 / 0.1.
+    ratio = t_end / d_t
+    steps = math.floor(ratio + min(ratio * STEP_TOLERANCE, 0.5))
+    # Drop a last point that the tolerance pushed past the end time.
+    if steps * d_t > t_end * (1 + TIME_TOLERANCE):
+        steps -= 1
+    return steps + 1
+
+
+def step_counts(d_t, t_end):
+    """
+    Count the time points of many simulations at once, with the same rule as step_count.
+
+    Parameters:
+    - d_t (numpy.ndarray): Positive time steps.
+    - t_end (numpy.ndarray): Final times, broadcastable against d_t.
+
+    Returns:
+    - numpy.ndarray: int64 numbers of time points.
+    """
+
+    ratio = t_end / d_t
+    steps = np.floor(ratio + np.minimum(ratio * STEP_TOLERANCE, 0.5)).astype(np.int64)
+    steps -= steps * d_t > t_end * (1 + TIME_TOLERANCE)
+    return np.where(t_end < 0, 0, steps + 1)
+
+
+def simulate_population_arrays(x0, a, d_t, t_end, exact=False):
+    """
+    Simulate exponential population growth with forward Euler steps, computed with NumPy instead of a loop.
+
+    Each Euler step multiplies the population by (1 + a*d_t), so the trajectory is a cumulative product
+    over a time grid built with np.arange.
+
+    Parameters:
+    - x0 (float): Initial population at time t=0.
+    - a (float): Growth rate coefficient.
+    - d_t (float): Incremental time step for the simulation.
+    - t_end (float): Final time to stop the simulation.
+    - exact (bool): Also return the exact solution x0*exp(a*t) and the relative error of the Euler steps.
+
+    Returns:
+    - numpy.ndarray: Structured array with 'time' and 'population' fields, plus 'exact' and 'error'
+      fields when exact is True.
+    """
+
+    # Compute the number of time points once, so the grid does not depend on accumulated rounding.
+    steps = step_count(d_t, t_end)
+    # Choose the output fields.
+    fields = [("time", "f8"), ("population", "f8")]
+    if exact:
+        fields += [("exact", "f8"), ("error", "f8")]
+    results = np.empty(steps, dtype=fields)
+    if steps == 0:
+        return results
+
+    # Build the time grid from the step index.
+    results["time"] = np.arange(steps) * d_t
+    # Every step applies the same growth factor; the first point is the initial population.
+    growth = np.full(steps, 1 + a * d_t)
+    growth[0] = x0
+    np.cumprod(growth, out=results["population"])
+
+    if exact:
+        # Compare the Euler trajectory with the exact solution of x_dot = a*x.
+        results["exact"] = x0 * np.exp(a * results["time"])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            results["error"] = (results["population"] - results["exact"]) / results["exact"]
+    return results
 
 
 def simulate_population_growth(x0, a, d_t, t_end):
     """
     Simulate exponential population growth based on given parameters.
 
+    Kept for callers of the list-of-tuples format; the values come from simulate_population_arrays.
+
     Parameters:
     - x0 (float): Initial population at time t=0.
     - a (float): Growth rate coefficient.
@@ -17,27 +136,432 @@ def simulate_population_growth(x0, a, d_t, t_end):
     - list: List of tuples containing time and corresponding population values.
     """
 
-    # Set the initial population from the provided value.
-    x = x0
-    # Start the simulation time at zero.
-    t = 0
-    # Create a list to store results, initializing with column headers.
-    results = [("Time", "Population")]
-    # Continue simulating until the simulation time exceeds the specified end time.
-
-    while t <= t_end:
-        # Add the current time and population to the results list.
-        results.append((t, x))
-        # Calculate the rate of change of the population.
-        x_dot = (a * x)
-        # Update the population value using the calculated rate and the time step.
-        x += (x_dot * d_t)
-        # Increment the simulation time by the time step.
-        t += d_t
+    # Run the vectorized simulation.
+    arrays = simulate_population_arrays(x0, a, d_t, t_end)
+    # Put the column headers first, then the time and population pairs as Python floats.
+    results = [("Time", "Population"), *zip(arrays["time"].tolist(), arrays["population"].tolist())]
     # Return the list of results.
     return results
 
 
+def iter_population_growth(x0, a, d_t, t_end):
+    """
+    Simulate exponential population growth one step at a time, yielding each point as it is computed.
+
+    Only the current population is kept, so a trajectory of any length runs in constant memory.
+
+    Parameters:
+    - x0 (float): Initial population at time t=0.
+    - a (float): Growth rate coefficient.
+    - d_t (float): Incremental time step for the simulation.
+    - t_end (float): Final time to stop the simulation.
+
+    Returns:
+    - generator: (time, population) tuples.
+    """
+
+    # Set the initial population from the provided value.
+    x = x0
+    for idx in range(step_count(d_t, t_end)):
+        # Yield the current time, taken from the step index, and population.
+        yield (idx * d_t, x)
+        # Update the population value using the rate of change and the time step.
+        x += (a * x) * d_t
+
+
+def _sweep_chunk(x0, a, d_t, steps, maxSteps):
+    """
+    Simulate a chunk of scenarios of a parameter sweep as one 2-D array computation.
+
+    Parameters:
+    - x0, a, d_t (numpy.ndarray): One-dimensional parameters of the scenarios in the chunk.
+    - steps (numpy.ndarray): Number of time points of each scenario.
+    - maxSteps (int): Number of columns of the output.
+
+    Returns:
+    - numpy.ndarray: Populations, one row per scenario, padded with NaN past each scenario's last point.
+    """
+
+    # Start every row from its growth factor and put the initial population in the first column.
+    populations = np.empty((len(x0), maxSteps))
+    populations[:] = (1 + a * d_t)[:, None]
+    populations[:, 0] = x0
+    # Accumulate the growth along each row in place.
+    np.cumprod(populations, axis=1, out=populations)
+    # Blank out the points past the end time of scenarios with coarser steps.
+    populations[_padding(steps, maxSteps)] = np.nan
+    return populations
+
+
+def _padding(steps, maxSteps):
+    """
+    Mark the points of a chunk of scenarios that lie past each scenario's last time point.
+
+    Parameters:
+    - steps (numpy.ndarray): Number of time points of each scenario.
+    - maxSteps (int): Number of columns of the output.
+
+    Returns:
+    - numpy.ndarray: Boolean mask of shape (len(steps), maxSteps).
+    """
+
+    return np.arange(maxSteps)[None, :] >= steps[:, None]
+
+
+def simulate_population_sweep(x0, a, d_t, t_end, maxBytes=1 << 26, workers=None, out=None, timesOut=None):
+    """
+    Simulate exponential population growth for many (x0, a, d_t) scenarios at once.
+
+    The parameters are broadcast against each other, so a full grid is built by giving them different axes,
+    for example x0[:, None] and a[None, :]. Scenarios are simulated in chunks of about maxBytes each, which
+    bounds the temporary memory, and the chunks can be spread across a process pool. Populations and times
+    are written chunk by chunk into out and timesOut, so with memory-mapped buffers the grid can be larger
+    than RAM.
+
+    Parameters:
+    - x0 (float or array): Initial populations at time t=0.
+    - a (float or array): Growth rate coefficients.
+    - d_t (float or array): Incremental time steps for the simulation.
+    - t_end (float or array): Final times to stop the simulation.
+    - maxBytes (int): Approximate size of the rows simulated at a time.
+    - workers (int): Number of worker processes (None or 1 to simulate in this process).
+    - out (numpy.ndarray): Optional preallocated float64 output for the populations, for example a
+      memory-mapped .npy file.
+    - timesOut (numpy.ndarray or bool): Optional preallocated float64 output for the times, or False to skip
+      them (time i of a scenario is i*d_t).
+
+    Returns:
+    - tuple: (times, populations, steps) where times and populations have the broadcast shape of the
+      parameters plus one time axis, padded with NaN past each scenario's last point (times is None when
+      timesOut is False), and steps holds the number of time points of each scenario.
+    """
+
+    # Broadcast the parameters to a common shape and flatten them into a list of scenarios.
+    x0, a, d_t, t_end = np.broadcast_arrays(*(np.asarray(value, dtype=float) for value in (x0, a, d_t, t_end)))
+    shape = x0.shape
+    x0, a, d_t, t_end = (value.ravel() for value in (x0, a, d_t, t_end))
+    if (d_t <= 0).any():
+        raise ValueError("Time step must be positive.")
+
+    # Count the time points of every scenario up front, with the rule of step_count.
+    steps = step_counts(d_t, t_end)
+    maxSteps = int(steps.max()) if steps.size else 0
+
+    # Write all the scenarios into one contiguous block.
+    out = np.empty((len(x0), maxSteps)) if out is None else out.reshape(len(x0), maxSteps)
+    if timesOut is not False:
+        timesOut = np.empty((len(x0), maxSteps)) if timesOut is None else timesOut.reshape(len(x0), maxSteps)
+    chunkRows = max(1, maxBytes // max(1, maxSteps * 8))
+    chunks = [slice(start, start + chunkRows) for start in range(0, len(x0), chunkRows)]
+
+    def store(chunk, populations):
+        out[chunk] = populations
+        if timesOut is not False:
+            # Times follow from the step index of each scenario.
+            times = np.arange(maxSteps)[None, :] * d_t[chunk, None]
+            times[_padding(steps[chunk], maxSteps)] = np.nan
+            timesOut[chunk] = times
+
+    if workers and workers > 1 and len(chunks) > 1:
+        # Keep a few chunks in flight per worker and store each one as it arrives, so finished chunks
+        # do not pile up in memory.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append((chunk, executor.submit(_sweep_chunk, x0[chunk], a[chunk], d_t[chunk],
+                                                       steps[chunk], maxSteps)))
+                if len(pending) >= 2 * workers:
+                    store(*_result(pending.popleft()))
+            while pending:
+                store(*_result(pending.popleft()))
+    else:
+        for chunk in chunks:
+            store(chunk, _sweep_chunk(x0[chunk], a[chunk], d_t[chunk], steps[chunk], maxSteps))
+
+    times = None if timesOut is False else timesOut.reshape(shape + (maxSteps,))
+    return times, out.reshape(shape + (maxSteps,)), steps.reshape(shape)
+
+
+def _result(item):
+    """
+    Wait for a pending sweep chunk.
+
+    Parameters:
+    - item (tuple): (chunk, future) of a submitted chunk.
+
+    Returns:
+    - tuple: (chunk, populations)
+    """
+
+    chunk, future = item
+    return chunk, future.result()
+
+
+def euler_step(rhs, t, x, h):
+    """
+    Advance x_dot = rhs(t, x) by one forward Euler step.
+
+    Parameters:
+    - rhs (callable): Right-hand side of the model, rhs(t, x).
+    - t (float): Current time.
+    - x (float): Current population.
+    - h (float): Step size.
+
+    Returns:
+    - float: Population at time t + h.
+    """
+
+    return x + h * rhs(t, x)
+
+
+def rk4_step(rhs, t, x, h):
+    """
+    Advance x_dot = rhs(t, x) by one classical fourth-order Runge-Kutta step.
+
+    Parameters:
+    - rhs (callable): Right-hand side of the model, rhs(t, x).
+    - t (float): Current time.
+    - x (float): Current population.
+    - h (float): Step size.
+
+    Returns:
+    - float: Population at time t + h.
+    """
+
+    k1 = rhs(t, x)
+    k2 = rhs(t + h / 2, x + h * k1 / 2)
+    k3 = rhs(t + h / 2, x + h * k2 / 2)
+    k4 = rhs(t + h, x + h * k3)
+    return x + h * (k1 + 2 * k2 + 2 * k3 + k4) / 6
+
+
+# Fixed-step integrators: step function and order of accuracy.
+FIXED_STEP_METHODS = {"euler": (euler_step, 1), "rk4": (rk4_step, 4)}
+
+# Dormand-Prince 5(4) coefficients: nodes, stage weights, fifth-order weights and error weights.
+DP_NODES = (0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1, 1)
+DP_STAGES = (
+    (),
+    (1 / 5,),
+    (3 / 40, 9 / 40),
+    (44 / 45, -56 / 15, 32 / 9),
+    (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+    (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+    (35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+)
+DP_ERROR = (71 / 57600, 0, -71 / 16695, 71 / 1920, -17253 / 339200, 22 / 525, -1 / 40)
+
+
+def growth_rhs(a):
+    """
+    Build the right-hand side of the exponential growth model x_dot = a*x.
+
+    Parameters:
+    - a (float): Growth rate coefficient.
+
+    Returns:
+    - callable: rhs(t, x).
+    """
+
+    return lambda t, x: a * x
+
+
+def logistic_rhs(a, capacity):
+    """
+    Build the right-hand side of the logistic growth model x_dot = a*x*(1 - x/capacity).
+
+    Parameters:
+    - a (float): Growth rate coefficient.
+    - capacity (float): Carrying capacity of the population.
+
+    Returns:
+    - callable: rhs(t, x).
+    """
+
+    return lambda t, x: a * x * (1 - x / capacity)
+
+
+def counted_rhs(rhs):
+    """
+    Wrap a right-hand side so that its calls are counted.
+
+    Parameters:
+    - rhs (callable): Right-hand side of the model, rhs(t, x).
+
+    Returns:
+    - tuple: (wrapped rhs, one-element list holding the number of calls so far)
+    """
+
+    calls = [0]
+
+    def wrapped(t, x):
+        calls[0] += 1
+        return rhs(t, x)
+
+    return wrapped, calls
+
+
+def integrate_fixed(rhs, x0, d_t, t_end, method="rk4"):
+    """
+    Integrate x_dot = rhs(t, x) with a fixed-step method.
+
+    The global error is estimated by Richardson extrapolation against a second run with steps of 2*d_t;
+    the evaluations of that run are counted in 'evaluations' and reported on their own as
+    'estimateEvaluations'.
+
+    Parameters:
+    - rhs (callable): Right-hand side of the model, rhs(t, x).
+    - x0 (float): Initial population at time t=0.
+    - d_t (float): Incremental time step for the simulation.
+    - t_end (float): Final time to stop the simulation.
+    - method (str): Name of the method in FIXED_STEP_METHODS.
+
+    Returns:
+    - tuple: (results, info) where results is a structured array with 'time' and 'population' fields and
+      info is a dictionary with the step and evaluation counts and the error estimate at the last point.
+    """
+
+    step, order = FIXED_STEP_METHODS[method]
+    rhs, calls = counted_rhs(rhs)
+    steps = step_count(d_t, t_end)
+
+    # Preallocate the trajectory and take each time from the step index.
+    results = np.empty(steps, dtype=[("time", "f8"), ("population", "f8")])
+    times = results["time"]
+    times[:] = np.arange(steps) * d_t
+    populations = results["population"]
+    if steps:
+        populations[0] = x0
+    # Each step produces the next stored point; none is taken past the last one.
+    for idx in range(steps - 1):
+        populations[idx + 1] = step(rhs, times[idx], populations[idx], d_t)
+    solutionEvaluations = calls[0]
+
+    # Repeat the run with doubled steps up to the last even point and compare the two.
+    errorEstimate = None
+    if steps > 2:
+        last = (steps - 1) // 2 * 2
+        coarse = x0
+        for idx in range(last // 2):
+            coarse = step(rhs, 2 * idx * d_t, coarse, 2 * d_t)
+        errorEstimate = float(abs(populations[last] - coarse) / (2 ** order - 1))
+
+    # Evaluations include the coarse run, like the error-estimating stages of the adaptive method.
+    info = {"method": method, "steps": max(steps - 1, 0), "rejected": 0, "evaluations": calls[0],
+            "estimateEvaluations": calls[0] - solutionEvaluations, "errorEstimate": errorEstimate}
+    return results, info
+
+
+def integrate_adaptive(rhs, x0, t_end, first_step=None, rtol=1e-6, atol=1e-9, max_steps=1000000):
+    """
+    Integrate x_dot = rhs(t, x) with the adaptive Dormand-Prince RK45 method.
+
+    Each step is accepted when the difference between its fifth- and fourth-order solutions is within
+    atol + rtol*|x|; otherwise it is retried with a smaller step. The step size then grows or shrinks
+    with the error, so smooth stretches are crossed in few steps.
+
+    Parameters:
+    - rhs (callable): Right-hand side of the model, rhs(t, x).
+    - x0 (float): Initial population at time t=0.
+    - t_end (float): Final time to stop the simulation.
+    - first_step (float): Initial step size (default: 1% of t_end).
+    - rtol (float): Relative tolerance of the local error.
+    - atol (float): Absolute tolerance of the local error.
+    - max_steps (int): Upper bound on the number of attempted (accepted and rejected) steps.
+
+    Returns:
+    - tuple: (results, info) where results is a structured array with 'time', 'population' and 'error'
+      (local error estimate of the step that reached each point) fields and info is a dictionary with the
+      step, rejection and evaluation counts and the summed error estimate.
+    """
+
+    t, x = 0.0, x0
+    h = first_step or t_end / 100 or 1.0
+    times, populations, errors = [t], [x], [0.0]
+    rejected = evaluations = 0
+    k1 = rhs(t, x)
+    evaluations += 1
+
+    while t < t_end:
+        # Rejected attempts count too, so a step size that keeps failing cannot loop forever.
+        if len(times) - 1 + rejected >= max_steps:
+            raise RuntimeError("Too many steps; loosen the tolerance.")
+        # Do not step past the end time.
+        h = min(h, t_end - t)
+        if h < np.spacing(t):
+            raise RuntimeError(f"Step size underflow at t={t:g}.")
+
+        # Evaluate the stages; the last one is at t + h with the fifth-order solution.
+        stages = [k1]
+        for stage in range(1, 7):
+            xStage = x + h * sum(weight * k for weight, k in zip(DP_STAGES[stage], stages))
+            stages.append(rhs(t + DP_NODES[stage] * h, xStage))
+        evaluations += 6
+        localError = abs(h * sum(weight * k for weight, k in zip(DP_ERROR, stages)))
+        scale = atol + rtol * max(abs(x), abs(xStage))
+        ratio = localError / scale
+        # An infinite or NaN solution would be rejected at every step size.
+        if not (math.isfinite(xStage) and math.isfinite(ratio)):
+            raise OverflowError(f"The solution is not finite beyond t={t:g}.")
+
+        if ratio <= 1:
+            # Accept the step; the last stage is the first stage of the next step.
+            t = t_end if t + h >= t_end else t + h
+            x = xStage
+            k1 = stages[6]
+            times.append(t)
+            populations.append(x)
+            errors.append(localError)
+        else:
+            rejected += 1
+        # Resize the step from the error, within a factor of 0.2 to 5.
+        h *= min(5.0, max(0.2, 0.9 * ratio ** -0.2)) if ratio else 5.0
+
+    results = np.empty(len(times), dtype=[("time", "f8"), ("population", "f8"), ("error", "f8")])
+    results["time"] = times
+    results["population"] = populations
+    results["error"] = errors
+    info = {"method": "rk45", "steps": len(times) - 1, "rejected": rejected, "evaluations": evaluations,
+            "errorEstimate": float(np.sum(results["error"]))}
+    return results, info
+
+
+def integrate_population(x0, a, d_t, t_end, method="rk4", rhs=None, rtol=1e-6, atol=1e-9):
+    """
+    Simulate population growth with a choice of integrator.
+
+    Without rhs the model is exponential growth x_dot = a*x, and the error against the exact solution
+    x0*exp(a*t_end) is added to the report.
+
+    Parameters:
+    - x0 (float): Initial population at time t=0.
+    - a (float): Growth rate coefficient.
+    - d_t (float): Time step, or the initial step of the adaptive method.
+    - t_end (float): Final time to stop the simulation.
+    - method (str): 'euler', 'rk4' or 'rk45'.
+    - rhs (callable): Other right-hand side rhs(t, x), for example logistic_rhs(a, capacity).
+    - rtol (float): Relative tolerance of the adaptive method.
+    - atol (float): Absolute tolerance of the adaptive method.
+
+    Returns:
+    - tuple: (results, info) as returned by integrate_fixed or integrate_adaptive.
+    """
+
+    model = rhs or growth_rhs(a)
+    if method == "rk45":
+        results, info = integrate_adaptive(model, x0, t_end, d_t, rtol, atol)
+    elif method in FIXED_STEP_METHODS:
+        results, info = integrate_fixed(model, x0, d_t, t_end, method)
+    else:
+        raise ValueError(f"Unknown integration method: {method}")
+
+    # The exponential model has an exact solution to compare with.
+    if rhs is None and len(results):
+        last = results[-1]
+        info["exactError"] = float(abs(last["population"] - x0 * math.exp(a * last["time"])))
+    return results, info
+
+
 def write_to_csv(results, fileName):
     """
     Write the simulation results to a CSV file with consistent spacing.
@@ -63,6 +587,176 @@ def write_to_csv(results, fileName):
                 columnGap) + f"{population:.2f}\n")
 
 
+def _time_width(*times):
+    """
+    Width of the time column: the widest of the given times with two decimals, plus one space.
+
+    Parameters:
+    - times (float): Times bounding the column, for example 0 and t_end.
+
+    Returns:
+    - int: Column width.
+    """
+
+    return max(len(f"{time:.2f}") for time in times) + 1
+
+
+def write_csv_stream(rows, fileName, t_end=None, columnGap=None, batchRows=8192, bufferSize=1 << 20):
+    """
+    Write simulation results to a CSV file as they are produced, with a fixed column width.
+
+    Unlike write_to_csv, the width is not measured from the results but computed up front from the end
+    time, so rows can come from a generator and are written in batches of batchRows lines through a large
+    file buffer.
+
+    Parameters:
+    - rows (iterable): (time, population) tuples, without a header row.
+    - fileName (str): Desired name for the output CSV file.
+    - t_end (float): Final time of the simulation, which sets the width of the time column.
+    - columnGap (int): Width of the time column, instead of the one computed from t_end.
+    - batchRows (int): Number of lines formatted before each write.
+    - bufferSize (int): Size of the file buffer in bytes.
+
+    Returns:
+    - int: Number of rows written.
+    """
+
+    if columnGap is None:
+        if t_end is None:
+            raise ValueError("Give t_end or columnGap to size the time column.")
+        columnGap = _time_width(0, t_end)
+
+    # One format string pads the time and formats the population in a single step.
+    lineFormat = f"{{:<{columnGap}.2f}}{{:.2f}}\n"
+    count = 0
+
+    # Open the specified CSV file for writing with a large buffer.
+    with open(fileName, "w", buffering=bufferSize) as file:
+        # Write the column headers with the same spacing.
+        file.write("Time".ljust(columnGap) + "Population\n")
+        batch = []
+        for time, population in rows:
+            batch.append(lineFormat.format(time, population))
+            # Hand each full batch to the file in one call.
+            if len(batch) == batchRows:
+                file.writelines(batch)
+                count += len(batch)
+                batch.clear()
+        file.writelines(batch)
+        count += len(batch)
+    return count
+
+
+def results_array(results):
+    """
+    Convert simulation results to a two-column float64 array of times and populations.
+
+    Parameters:
+    - results: Structured array from simulate_population_arrays or integrate_population, list of tuples
+      from simulate_population_growth (with or without its header row), or an (n, 2) array.
+
+    Returns:
+    - numpy.ndarray: C-contiguous (n, 2) float64 array.
+    """
+
+    # Structured arrays already hold the columns as float64.
+    if isinstance(results, np.ndarray) and results.dtype.names:
+        return np.column_stack((results["time"], results["population"]))
+    # Skip the header row of the list format.
+    if len(results) and isinstance(results[0][0], str):
+        results = results[1:]
+    return np.ascontiguousarray(np.asarray(results, dtype=np.float64).reshape(-1, 2))
+
+
+def _write_text(file, data, columnGap, chunkRows):
+    """
+    Write an (n, 2) array as aligned text, formatting each chunk of rows in a single operation.
+
+    Parameters:
+    - file: Text file object to write to.
+    - data (numpy.ndarray): (n, 2) array of times and populations.
+    - columnGap (int): Width of the time column.
+    - chunkRows (int): Number of rows formatted at a time.
+
+    Returns:
+    - None
+    """
+
+    lineFormat = f"%-{columnGap}.2f%.2f\n"
+    file.write("Time".ljust(columnGap) + "Population\n")
+    for start in range(0, len(data), chunkRows):
+        chunk = data[start:start + chunkRows]
+        # One % operation formats every value of the chunk.
+        file.write((lineFormat * len(chunk)) % tuple(chunk.ravel().tolist()))
+
+
+def write_results(results, fileName, columnGap=None, chunkRows=1 << 16):
+    """
+    Write simulation results in the format given by the file extension.
+
+    - '.npy': raw (n, 2) float64 array, readable with np.load(fileName, mmap_mode='r').
+    - '.cols': directory with one float64 .npy file per column ('time.npy', 'population.npy'), written
+      chunk by chunk; each column can be memory-mapped on its own.
+    - '.csv', '.csv.gz', '.csv.zst': aligned text like write_csv_stream, optionally compressed with gzip
+      or zstandard.
+
+    Parameters:
+    - results: Simulation results in any format accepted by results_array.
+    - fileName (str): Desired name for the output file or directory.
+    - columnGap (int): Width of the time column of the text formats (default: the widest time plus one
+      space).
+    - chunkRows (int): Number of rows converted or formatted at a time.
+
+    Returns:
+    - None
+    """
+
+    data = results_array(results)
+    # Size the time column once from the smallest and largest times.
+    if columnGap is None:
+        columnGap = _time_width(data[:, 0].min(initial=0), data[:, 0].max(initial=0))
+
+    if fileName.endswith(".npy"):
+        np.save(fileName, data)
+    elif fileName.endswith(".cols"):
+        os.makedirs(fileName, exist_ok=True)
+        for columnIdx, name in enumerate(("time", "population")):
+            # Allocate the column file on disk and fill it a chunk at a time.
+            column = np.lib.format.open_memmap(os.path.join(fileName, name + ".npy"), mode="w+",
+                                               dtype=np.float64, shape=(len(data),))
+            for start in range(0, len(data), chunkRows):
+                column[start:start + chunkRows] = data[start:start + chunkRows, columnIdx]
+            column.flush()
+            del column
+    elif fileName.endswith(".csv.gz"):
+        with gzip.open(fileName, "wt", compresslevel=6) as file:
+            _write_text(file, data, columnGap, chunkRows)
+    elif fileName.endswith(".csv.zst"):
+        if zstandard is None:
+            raise ImportError("Writing '.zst' files requires the 'zstandard' package.")
+        with zstandard.open(fileName, "wt") as file:
+            _write_text(file, data, columnGap, chunkRows)
+    elif fileName.endswith(".csv"):
+        with open(fileName, "w", buffering=1 << 20) as file:
+            _write_text(file, data, columnGap, chunkRows)
+    else:
+        raise ValueError(f"Unknown output format: {fileName}")
+
+
+def read_columns(fileName):
+    """
+    Memory-map the columns written by write_results in the '.cols' format.
+
+    Parameters:
+    - fileName (str): Name of the '.cols' directory.
+
+    Returns:
+    - dict: Read-only memory-mapped arrays keyed by column name.
+    """
+
+    return {name: np.load(os.path.join(fileName, name + ".npy"), mmap_mode="r") for name in ("time", "population")}
+
+
 def main():
     """
     Main execution function. Simulates exponential growth, displays results, and writes them to a CSV.
@@ -1,6 +1,15 @@
 ### START:
 # Import the necessary module to handle CSV files.
 import csv
+# Import 'sys' for the default output stream.
+import sys
+# Import 'heapq', 'itertools' and 'tempfile' for the external merge sort.
+import heapq
+import itertools
+import tempfile
+from contextlib import ExitStack
+# Import NumPy for the typed numeric columns of the element table.
+import numpy as np
 
 
 def read_elements(file_name):
@@ -22,6 +31,311 @@ def read_elements(file_name):
         return [row for row in reader]
 
 
+def parse_column(values):
+    """
+    Convert the text cells of one column to the narrowest type that fits all of them.
+
+    Parameters:
+    - values (list): Text cells of the column, without the header.
+
+    Returns:
+    - numpy.ndarray or list: int64 or float64 array for numeric columns, otherwise the list of strings.
+    """
+
+    # Try integers first, then floats; anything else stays text.
+    for dtype in (np.int64, np.float64):
+        try:
+            return np.array(values, dtype=dtype)
+        except ValueError:
+            continue
+    return list(values)
+
+
+class ElementTable:
+    """
+    Element table parsed once into typed columns, with indexes by atomic number and symbol.
+
+    The first column is the atomic number and the second the symbol, as in First_Eight_Elements.csv;
+    any further columns (names, masses, ...) are typed by parse_column. Sorted orders and the aligned text
+    lines of each order are computed on first use and cached, so repeated sorted printing neither re-sorts
+    nor re-converts.
+
+    Parameters:
+    - rows (list): Rows from read_elements, header first.
+    """
+
+    def __init__(self, rows):
+        # Keep the header and the original text of the cells for printing.
+        self.header = rows[0]
+        self.text = rows[1:]
+        # Parse every column once.
+        self.columns = [parse_column([row[colIdx] for row in self.text]) for colIdx in range(len(self.header))]
+        self.numbers = self.columns[0]
+        self.symbols = self.columns[1]
+        # Index each row by its atomic number and by its symbol.
+        self.byNumber = {number: rowIdx for rowIdx, number in enumerate(self.numbers.tolist())}
+        self.bySymbol = {symbol: rowIdx for rowIdx, symbol in enumerate(self.symbols)}
+        # Measure the column widths once, header included.
+        self.columnWidths = [max(len(row[colIdx]) for row in rows) for colIdx in range(len(self.header))]
+        self._orders = {}
+        self._lines = {}
+
+    def __len__(self):
+        return len(self.text)
+
+    def row(self, rowIdx):
+        """
+        Return one element as a dictionary of typed values keyed by the header.
+
+        Parameters:
+        - rowIdx (int): Position of the element in the file.
+
+        Returns:
+        - dict: Column values of the element.
+        """
+
+        return {name: (column[rowIdx].item() if isinstance(column, np.ndarray) else column[rowIdx])
+                for name, column in zip(self.header, self.columns)}
+
+    def by_number(self, number):
+        """
+        Look up an element by atomic number.
+
+        Parameters:
+        - number (int): Atomic number.
+
+        Returns:
+        - dict: Column values of the element (KeyError if there is none).
+        """
+
+        return self.row(self.byNumber[number])
+
+    def by_symbol(self, symbol):
+        """
+        Look up an element by symbol.
+
+        Parameters:
+        - symbol (str): Chemical symbol, for example 'He'.
+
+        Returns:
+        - dict: Column values of the element (KeyError if there is none).
+        """
+
+        return self.row(self.bySymbol[symbol])
+
+    def sorted_order(self, colIdx=0, reverse=False):
+        """
+        Return the row positions sorted by one column, computed once per column and direction.
+
+        Equal values keep their file order in both directions, like sorted(..., reverse=True).
+
+        Parameters:
+        - colIdx (int): Column to sort by (default: atomic number).
+        - reverse (bool): Sort in descending order.
+
+        Returns:
+        - numpy.ndarray: Row positions in sorted order.
+        """
+
+        key = (colIdx, reverse)
+        if key not in self._orders:
+            column = self.columns[colIdx]
+            if isinstance(column, np.ndarray):
+                # A stable sort of the negated values keeps ties in file order when descending.
+                self._orders[key] = np.argsort(-column if reverse else column, kind="stable")
+            else:
+                self._orders[key] = np.array(sorted(range(len(column)), key=column.__getitem__, reverse=reverse),
+                                             dtype=np.int64)
+        return self._orders[key]
+
+    def format_row(self, row):
+        """
+        Align the cells of one row to the column widths.
+
+        Parameters:
+        - row (list): Text cells of the row.
+
+        Returns:
+        - str: The aligned row.
+        """
+
+        return ' '.join(word.ljust(self.columnWidths[idx]) for idx, word in enumerate(row))
+
+    def sorted_lines(self, colIdx=0, reverse=False):
+        """
+        Return the aligned text lines of the table in sorted order, header first, cached per order.
+
+        Parameters:
+        - colIdx (int): Column to sort by (default: atomic number).
+        - reverse (bool): Sort in descending order.
+
+        Returns:
+        - list: Aligned lines without newlines.
+        """
+
+        key = (colIdx, reverse)
+        if key not in self._lines:
+            self._lines[key] = [self.format_row(self.header)] + \
+                [self.format_row(self.text[rowIdx]) for rowIdx in self.sorted_order(colIdx, reverse).tolist()]
+        return self._lines[key]
+
+
+def load_element_table(file_name):
+    """
+    Read an element CSV file into an ElementTable.
+
+    Parameters:
+    - file_name (str): Name of the CSV file to read.
+
+    Returns:
+    - ElementTable: The parsed and indexed table.
+    """
+
+    return ElementTable(read_elements(file_name))
+
+
+def iter_elements(file_name):
+    """
+    Yield the rows of an element CSV file one at a time, header first.
+
+    Parameters:
+    - file_name (str): Name of the CSV file to read.
+
+    Returns:
+    - generator: Rows as lists of column values.
+    """
+
+    with open(file_name, 'r', newline='') as file:
+        yield from csv.reader(file)
+
+
+def parse_schema(header):
+    """
+    Read column widths declared in the header as 'Name:width' cells, for example 'Atomic_Number:13'.
+
+    Parameters:
+    - header (list): Header cells.
+
+    Returns:
+    - tuple: (names, widths) with the annotations removed, or (header, None) if any cell has no width.
+    """
+
+    names, widths = [], []
+    for cell in header:
+        name, _, width = cell.rpartition(':')
+        if not name or not width.isdigit():
+            return header, None
+        names.append(name)
+        # A column is never narrower than its name.
+        widths.append(max(int(width), len(name)))
+    return names, widths
+
+
+def sample_widths(header, rows, sampleRows=1000):
+    """
+    Measure the column widths from the header and a bounded sample of the rows.
+
+    Rows past the sample that are wider than their column are printed in full and shift that line only.
+
+    Parameters:
+    - header (list): Header cells.
+    - rows (iterator): The data rows; the sampled rows are consumed from it.
+    - sampleRows (int): Maximum number of rows to measure.
+
+    Returns:
+    - tuple: (widths, sample) where sample holds the rows that were read, to be printed before the rest.
+    """
+
+    sample = list(itertools.islice(rows, sampleRows))
+    widths = [max([len(cell)] + [len(row[colIdx]) for row in sample]) for colIdx, cell in enumerate(header)]
+    return widths, sample
+
+
+def render_table(rows, widths, output=None, blockRows=4096):
+    """
+    Write aligned rows to an output stream, joining blocks of lines into a single write.
+
+    Parameters:
+    - rows (iterable): Rows to print, header included if it should be printed.
+    - widths (list): Width of each column.
+    - output (file): Stream to write to (default: standard output).
+    - blockRows (int): Number of lines per write.
+
+    Returns:
+    - int: Number of rows written.
+    """
+
+    output = output or sys.stdout
+    # One format string pads every column, the last one too, as ljust did.
+    lineFormat = ' '.join(f'{{:<{width}}}' for width in widths) + '\n'
+    count = 0
+    for block in iter(lambda: list(itertools.islice(rows, blockRows)), []):
+        output.write(''.join(lineFormat.format(*row) for row in block))
+        count += len(block)
+    return count
+
+
+def external_sort(rows, key, reverse=False, runRows=100000):
+    """
+    Sort rows that may not fit in memory: sorted runs of runRows rows are spilled to temporary files and
+    merged back lazily. Equal keys keep their input order, like sorted().
+
+    Parameters:
+    - rows (iterable): The rows to sort.
+    - key (callable): Sort key of a row, for example lambda row: int(row[0]).
+    - reverse (bool): Sort in descending order.
+    - runRows (int): Number of rows sorted in memory at a time.
+
+    Returns:
+    - generator: The rows in sorted order.
+    """
+
+    rows = iter(rows)
+    with ExitStack() as stack:
+        runs = []
+        for run in iter(lambda: list(itertools.islice(rows, runRows)), []):
+            run.sort(key=key, reverse=reverse)
+            # A single run is merged straight from memory.
+            if not runs and len(run) < runRows:
+                yield from run
+                return
+            spill = stack.enter_context(tempfile.TemporaryFile('w+', newline=''))
+            csv.writer(spill).writerows(run)
+            spill.seek(0)
+            runs.append(csv.reader(spill))
+        yield from heapq.merge(*runs, key=key, reverse=reverse)
+
+
+def stream_table(file_name, output=None, sortByNumber=True, reverse=True, sampleRows=1000, runRows=100000):
+    """
+    Print an element CSV file as an aligned table without loading it whole.
+
+    Widths come from 'Name:width' header annotations when present, otherwise from the header and the first
+    sampleRows rows. Sorting by atomic number uses external_sort.
+
+    Parameters:
+    - file_name (str): Name of the CSV file to read.
+    - output (file): Stream to write to (default: standard output).
+    - sortByNumber (bool): Sort the rows by atomic number.
+    - reverse (bool): Sort in descending order.
+    - sampleRows (int): Number of rows measured when the header declares no widths.
+    - runRows (int): Number of rows sorted in memory at a time.
+
+    Returns:
+    - int: Number of rows written, header included.
+    """
+
+    rows = iter_elements(file_name)
+    header, widths = parse_schema(next(rows))
+    if sortByNumber:
+        rows = external_sort(rows, key=lambda row: int(row[0]), reverse=reverse, runRows=runRows)
+    # Without a schema, measure a sample and print it ahead of the remaining rows.
+    if widths is None:
+        widths, sample = sample_widths(header, rows, sampleRows)
+        rows = itertools.chain(sample, rows)
+    return render_table(itertools.chain([header], rows), widths, output)
+
+
 def main():
     """
     Main execution function. Reads elements from a CSV file, sorts based on atomic number in reverse, 
@@ -31,25 +345,12 @@ def main():
     - None
     """
 
-    # Read the elements from the specified CSV file.
-    rows = read_elements('First_Eight_Elements.csv')
-    # Calculate the maximum width needed for each column to ensure proper alignment when printing.
-    columnWidths = [max(len(row[colIdx]) for row in rows)
-        for colIdx in range(len(rows[0]))
-    ]
-
-    # Print the header row, ensuring each header aligns with its column width.
-    print(' '.join(word.ljust(columnWidths[idx])
-          for idx, word in enumerate(rows[0])))
-
-    ## Sort the rows (excluding the header) based on atomic number in reverse order.
-    # The lambda function is used to extract the atomic number (as an integer) from each row to serve as the sorting key.
-    sortedRows = sorted(rows[1:], key = (lambda x: int(x[0])), reverse = True)
+    # Read and index the elements from the specified CSV file.
+    table = load_element_table('First_Eight_Elements.csv')
 
-    # Print each sorted row, ensuring columns are properly aligned.
-    for row in sortedRows:
-        print(' '.join(word.ljust(columnWidths[idx])
-              for idx, word in enumerate(row)))
+    ## Print the header and the rows sorted by atomic number in reverse order, with aligned columns.
+    # The sorted, aligned lines are computed once and cached by the table.
+    print('\n'.join(table.sorted_lines(0, reverse = True)))
 
 
 # This conditional ensures that the main function is executed only when this script is run directly (not imported).
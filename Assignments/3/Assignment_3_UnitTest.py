@@ -0,0 +1,248 @@
+import unittest
+import io
+import os
+import gzip
+import math
+import random
+import tempfile
+import importlib
+import itertools
+import numpy as np
+
+# The assignment modules have hyphenated names, so they are imported by name.
+populationModule = importlib.import_module("Assignment_3-1")
+elementsModule = importlib.import_module("Assignment_3-2")
+
+# The element file sits next to this module.
+ELEMENTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "First_Eight_Elements.csv")
+
+
+class TestFunctions(unittest.TestCase):
+
+    def test_step_count(self):
+        # End times on the grid are included despite the rounding of the division.
+        self.assertEqual(populationModule.step_count(0.1, 2), 21)
+        self.assertEqual(populationModule.step_count(0.1, 0.3), 4)
+        self.assertEqual(populationModule.step_count(1e-5, 1000), 100000001)
+        # Fine grids do not gain a point past the end time.
+        self.assertEqual(populationModule.step_count(1e-12, 1.0000000000005), 1000000000001)
+        self.assertEqual(populationModule.step_count(0.1, -1), 0)
+        with self.assertRaises(ValueError):
+            populationModule.step_count(0, 1)
+        # Simulations end on the last grid point for steps whose sum drifts, such as 0.1 and 0.01.
+        for d_t in (0.1, 0.01):
+            results = populationModule.simulate_population_arrays(100, 5, d_t, 2)
+            self.assertEqual(len(results), populationModule.step_count(d_t, 2))
+            self.assertAlmostEqual(results["time"][-1], 2.0, places=12)
+        # The vectorized count follows the same rule.
+        counts = populationModule.step_counts(np.array([0.1, 0.1, 1e-5, 1e-12]),
+                                              np.array([2, 0.3, 1000, 1.0000000000005]))
+        self.assertEqual(counts.tolist(), [21, 4, 100000001, 1000000000001])
+
+    def test_simulate_population_growth(self):
+        results = populationModule.simulate_population_growth(100, 5, 0.1, 2)
+        self.assertEqual(results[0], ("Time", "Population"))
+        self.assertEqual(len(results), 22)
+        self.assertEqual(results[-1][0], 2.0)
+        # The vectorized results match the step-by-step recurrence.
+        population = 100
+        for time, value in results[1:]:
+            self.assertAlmostEqual(value, population, delta=1e-9 * population)
+            population += 5 * population * 0.1
+
+    def test_simulate_population_arrays(self):
+        results = populationModule.simulate_population_arrays(100, 5, 0.1, 2, exact=True)
+        self.assertEqual(results.dtype.names, ("time", "population", "exact", "error"))
+        self.assertEqual(len(results), 21)
+        # The exact solution and the relative error of the Euler steps are reported at every point.
+        np.testing.assert_allclose(results["exact"], 100 * np.exp(5 * results["time"]), rtol=1e-12)
+        self.assertEqual(results["error"][0], 0.0)
+        self.assertTrue((results["error"][1:] < 0).all())
+        # Euler steps are first order: a ten times smaller step gives about a ten times smaller error.
+        coarse = populationModule.simulate_population_arrays(100, 5, 1e-3, 2, exact=True)
+        finer = populationModule.simulate_population_arrays(100, 5, 1e-4, 2, exact=True)
+        self.assertAlmostEqual(finer["error"][-1] / coarse["error"][-1], 0.1, delta=0.01)
+        # Without points there is nothing to compute.
+        self.assertEqual(len(populationModule.simulate_population_arrays(100, 5, 0.1, -1)), 0)
+
+    def test_population_sweep(self):
+        d_t = np.array([0.1, 0.25, 0.5])
+        times, populations, steps = populationModule.simulate_population_sweep(100, 5, d_t, 2, maxBytes=8)
+        self.assertEqual(steps.tolist(), [21, 9, 5])
+        self.assertEqual(populations.shape, (3, 21))
+        # Each row matches the single simulation and is padded with NaN past its last point.
+        for row, step in enumerate(d_t):
+            single = populationModule.simulate_population_arrays(100, 5, step, 2)
+            count = steps[row]
+            np.testing.assert_allclose(populations[row, :count], single["population"], rtol=1e-12)
+            np.testing.assert_allclose(times[row, :count], single["time"], rtol=1e-12)
+            self.assertTrue(np.isnan(populations[row, count:]).all())
+            self.assertTrue(np.isnan(times[row, count:]).all())
+        # A grid of parameters spread over worker processes fills a preallocated output.
+        out = np.empty(2 * 3 * 21)
+        _, grid, _ = populationModule.simulate_population_sweep(np.array([100, 200])[:, None], 5, d_t[None, :], 2,
+                                                                maxBytes=8, workers=2, out=out, timesOut=False)
+        self.assertEqual(grid.shape, (2, 3, 21))
+        self.assertTrue(np.shares_memory(grid, out))
+        np.testing.assert_array_equal(grid[0], populations)
+        np.testing.assert_allclose(grid[1], 2 * populations, rtol=1e-12)
+        # Times can be skipped.
+        self.assertIsNone(populationModule.simulate_population_sweep(100, 5, d_t, 2, timesOut=False)[0])
+
+    def test_iter_population_growth(self):
+        # The generator yields the points of the vectorized simulation.
+        points = list(populationModule.iter_population_growth(100, 5, 0.1, 2))
+        results = populationModule.simulate_population_growth(100, 5, 0.1, 2)[1:]
+        self.assertEqual([time for time, _ in points], [time for time, _ in results])
+        for (_, population), (_, expected) in zip(points, results):
+            self.assertAlmostEqual(population, expected, delta=1e-9 * expected)
+        # Points are computed on demand, so a very long horizon costs nothing until it is consumed.
+        first = list(itertools.islice(populationModule.iter_population_growth(1, 0.5, 1e-9, 1e6), 3))
+        self.assertEqual([time for time, _ in first], [0, 1e-9, 2e-9])
+
+    def test_write_csv_stream(self):
+        results = populationModule.simulate_population_growth(100, 5, 0.1, 2)
+        with tempfile.TemporaryDirectory() as directory:
+            # With write_to_csv's column width, the streamed file is identical to it.
+            expectedFile = os.path.join(directory, "expected.csv")
+            populationModule.write_to_csv(results, expectedFile)
+            columnGap = max(len(str(time)) for time, _ in results[1:])
+            streamFile = os.path.join(directory, "stream.csv")
+            count = populationModule.write_csv_stream(populationModule.iter_population_growth(100, 5, 0.1, 2),
+                                                      streamFile, columnGap=columnGap)
+            self.assertEqual(count, 21)
+            with open(expectedFile) as expected, open(streamFile) as streamed:
+                self.assertEqual(streamed.read(), expected.read())
+
+            # Batches that do not divide the rows evenly write the same file as a single batch.
+            rows = results[1:11]
+            populationModule.write_csv_stream(rows, expectedFile, t_end=2)
+            self.assertEqual(populationModule.write_csv_stream(rows, streamFile, t_end=2, batchRows=3), 10)
+            with open(expectedFile) as expected, open(streamFile) as streamed:
+                self.assertEqual(streamed.read(), expected.read())
+
+            # The width follows from the end time, so large times stay apart from the population.
+            populationModule.write_csv_stream([(0, 1), (1e8, 1)], streamFile, t_end=1e8)
+            with open(streamFile) as streamed:
+                self.assertEqual(streamed.read().splitlines()[-1], "100000000.00 1.00")
+            with self.assertRaises(ValueError):
+                populationModule.write_csv_stream(rows, streamFile)
+
+    def test_write_results(self):
+        arrays = populationModule.simulate_population_arrays(100, 5, 0.1, 2)
+        expected = np.column_stack((arrays["time"], arrays["population"]))
+        with tempfile.TemporaryDirectory() as directory:
+            npyFile = os.path.join(directory, "results.npy")
+            populationModule.write_results(arrays, npyFile)
+            np.testing.assert_array_equal(np.load(npyFile), expected)
+
+            # The column directory is written in small chunks and memory-mapped back.
+            colsFile = os.path.join(directory, "results.cols")
+            populationModule.write_results(arrays, colsFile, chunkRows=4)
+            columns = populationModule.read_columns(colsFile)
+            np.testing.assert_array_equal(columns["time"], expected[:, 0])
+            np.testing.assert_array_equal(columns["population"], expected[:, 1])
+            del columns
+
+            # The compressed text matches the plain text.
+            csvFile = os.path.join(directory, "results.csv")
+            populationModule.write_results(arrays, csvFile, chunkRows=4)
+            populationModule.write_results(arrays, csvFile + ".gz", chunkRows=4)
+            with open(csvFile) as file, gzip.open(csvFile + ".gz", "rt") as compressed:
+                text = file.read()
+                self.assertEqual(compressed.read(), text)
+            lines = text.splitlines()
+            self.assertEqual(lines[0], "Time Population")
+            self.assertEqual(len(lines), 22)
+            self.assertEqual(lines[-1], f"2.00 {expected[-1, 1]:.2f}")
+
+            # The time column grows with the largest time.
+            populationModule.write_results(np.array([[0, 1], [1e8, 2]]), csvFile)
+            with open(csvFile) as file:
+                self.assertEqual(file.read().splitlines()[-1], "100000000.00 2.00")
+
+            with self.assertRaises(ValueError):
+                populationModule.write_results(arrays, os.path.join(directory, "results.txt"))
+
+    def test_dormand_prince_tableau(self):
+        # Every stage is evaluated at the time given by the sum of its weights.
+        for node, weights in zip(populationModule.DP_NODES[1:], populationModule.DP_STAGES[1:]):
+            self.assertAlmostEqual(sum(weights), node, places=12)
+        # The fifth-order weights are consistent and the error weights cancel on constants.
+        self.assertAlmostEqual(sum(populationModule.DP_STAGES[6]), 1.0, places=12)
+        self.assertAlmostEqual(sum(populationModule.DP_ERROR), 0.0, places=12)
+
+    def test_integrate_adaptive(self):
+        results, info = populationModule.integrate_population(100, 5, 0.1, 2, method="rk45", rtol=1e-8, atol=1e-8)
+        exact = 100 * math.exp(10)
+        self.assertEqual(results["time"][-1], 2.0)
+        self.assertLess(info["exactError"] / exact, 1e-5)
+        # Smooth growth is crossed in far fewer steps than a fixed grid would need.
+        self.assertLess(info["steps"], 200)
+        # One evaluation to start, then six per attempted step.
+        self.assertEqual(info["evaluations"], 1 + 6 * (info["steps"] + info["rejected"]))
+
+    def test_integrate_adaptive_failures(self):
+        # A solution that overflows stops the integration instead of shrinking the step forever.
+        with self.assertRaises(OverflowError):
+            populationModule.integrate_population(100, 1000, 0.1, 10, method="rk45")
+        # A solution that blows up in finite time runs the step size down to the spacing of t.
+        with self.assertRaises(RuntimeError):
+            populationModule.integrate_adaptive(lambda t, x: x * x, 1.0, 2.0)
+        # Rejected attempts count towards the step limit.
+        with self.assertRaises(RuntimeError):
+            populationModule.integrate_adaptive(populationModule.growth_rhs(5), 100, 2, max_steps=5)
+
+    def test_integrate_fixed(self):
+        for method, evaluations in (("euler", 1), ("rk4", 4)):
+            results, info = populationModule.integrate_population(100, 5, 1e-3, 2, method=method)
+            self.assertEqual(len(results), 2001)
+            self.assertEqual(info["steps"], 2000)
+            # The coarse run of the error estimate takes half as many steps again.
+            self.assertEqual(info["estimateEvaluations"], 1000 * evaluations)
+            self.assertEqual(info["evaluations"], 3000 * evaluations)
+            # Richardson extrapolation estimates the real error to within a few percent.
+            self.assertLess(abs(info["errorEstimate"] - info["exactError"]), 0.05 * info["exactError"])
+        with self.assertRaises(ValueError):
+            populationModule.integrate_population(100, 5, 0.1, 2, method="midpoint")
+
+    def test_element_table(self):
+        table = elementsModule.load_element_table(ELEMENTS_FILE)
+        self.assertEqual(len(table), 8)
+        # Numeric columns are parsed into typed arrays.
+        self.assertEqual(table.numbers.dtype.kind, "i")
+        self.assertEqual(table.by_symbol("He"), {"Atomic_Number": 2, "Symbol": "He", "Name": "Helium"})
+        self.assertEqual(table.by_number(8)["Name"], "Oxygen")
+        with self.assertRaises(KeyError):
+            table.by_symbol("Xx")
+        # Sorted lines are computed once per order and then reused.
+        lines = table.sorted_lines(0, reverse=True)
+        self.assertIs(table.sorted_lines(0, reverse=True), lines)
+        self.assertEqual([line.split()[1] for line in lines[1:]], ["O", "N", "C", "B", "Be", "Li", "He", "H"])
+        self.assertEqual(len({len(line) for line in lines}), 1)
+
+    def test_external_sort(self):
+        rows = [[str(random.randint(0, 20)), str(idx)] for idx in range(500)]
+        for reverse in (False, True):
+            expected = sorted(rows, key=lambda row: int(row[0]), reverse=reverse)
+            # Small runs force spilled runs to be merged; equal keys keep their input order.
+            for runRows in (7, 1000):
+                sortedRows = list(elementsModule.external_sort(rows, key=lambda row: int(row[0]),
+                                                               reverse=reverse, runRows=runRows))
+                self.assertEqual(sortedRows, expected)
+
+    def test_stream_table(self):
+        # Streaming the file prints the same table as the in-memory version.
+        table = elementsModule.load_element_table(ELEMENTS_FILE)
+        output = io.StringIO()
+        count = elementsModule.stream_table(ELEMENTS_FILE, output, runRows=3)
+        self.assertEqual(count, 9)
+        self.assertEqual(output.getvalue(), "\n".join(table.sorted_lines(0, reverse=True)) + "\n")
+        # Widths declared in the header are used as given, but never narrower than the names.
+        self.assertEqual(elementsModule.parse_schema(["Atomic_Number:3", "Symbol:8"]),
+                         (["Atomic_Number", "Symbol"], [13, 8]))
+        self.assertIsNone(elementsModule.parse_schema(["Atomic_Number", "Symbol:8"])[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
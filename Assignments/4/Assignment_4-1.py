@@ -1,5 +1,8 @@
 import random
+import math
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 
 
 def simulate_die_rolls():
@@ -27,6 +30,183 @@ def simulate_die_rolls():
         print(f"Number {number} appeared {count} times.")
 
 
+def roll_counts(rolls, faces=6, dice=1, seed=None, chunkSize=1 << 22):
+    """
+    Count the outcomes of many rolls of one or more fair dice without storing the rolls.
+
+    Rolls are drawn in chunks from a seeded NumPy Generator and each chunk is tallied with np.bincount,
+    so memory stays bounded by chunkSize whatever the number of rolls.
+
+    Args:
+    rolls (int): Number of rolls.
+    faces (int): Number of faces of each die.
+    dice (int): Number of dice thrown per roll; the outcome of a roll is their sum.
+    seed (int, SeedSequence or Generator): Seed of the random generator (None for fresh entropy).
+    chunkSize (int): Maximum number of dice drawn at a time.
+
+    Returns:
+    numpy.ndarray: Counts indexed by outcome, from 0 to dice*faces (outcomes below dice are always zero).
+    """
+
+    if faces < 1 or dice < 1:
+        raise ValueError("A roll needs at least one die with at least one face.")
+    generator = np.random.default_rng(seed)
+    # Draw faces in the smallest integer type that holds them.
+    dtype = np.uint8 if faces < 256 else np.int64
+    counts = np.zeros(dice * faces + 1, dtype=np.int64)
+    chunkRolls = max(1, chunkSize // dice)
+
+    for start in range(0, rolls, chunkRolls):
+        size = min(chunkRolls, rolls - start)
+        draws = generator.integers(1, faces + 1, size=(size, dice), dtype=dtype)
+        # A single die is counted directly; several dice are summed per roll first.
+        outcomes = draws[:, 0] if dice == 1 else draws.sum(axis=1, dtype=np.int64)
+        counts += np.bincount(outcomes, minlength=len(counts))
+    return counts
+
+
+def counts_to_counter(counts):
+    """
+    Convert an array of outcome counts into a Counter of the outcomes that occurred.
+
+    Args:
+    counts (numpy.ndarray): Counts indexed by outcome.
+
+    Returns:
+    Counter: Outcome to count, for the non-zero counts.
+    """
+
+    outcomes = np.flatnonzero(counts)
+    return Counter(dict(zip(outcomes.tolist(), counts[outcomes].tolist())))
+
+
+def simulate_die_rolls_numpy(rolls=100, faces=6, dice=1, k=3, seed=None, verbose=True):
+    """
+    Simulate rolls of fair dice with NumPy and report the k most common outcomes.
+
+    Returns the same most_common(k) list as a Counter of the individual rolls would; outcomes with equal
+    counts are listed in increasing order.
+
+    Args:
+    rolls (int): Number of rolls.
+    faces (int): Number of faces of each die.
+    dice (int): Number of dice thrown per roll.
+    k (int): Number of outcomes to report (None for all of them).
+    seed (int): Seed of the random generator (None for fresh entropy).
+    verbose (bool): Print the outcomes like simulate_die_rolls.
+
+    Returns:
+    list: (outcome, count) tuples, most common first.
+    """
+
+    mostCommon = counts_to_counter(roll_counts(rolls, faces, dice, seed)).most_common(k)
+    if verbose:
+        for number, count in mostCommon:
+            print(f"Number {number} appeared {count} times.")
+    return mostCommon
+
+
+def _block_counts(args):
+    """
+    Count one block of a parallel simulation; runs in a worker process.
+
+    Args:
+    args (tuple): (rolls, faces, dice, seedSequence) of the block.
+
+    Returns:
+    numpy.ndarray: Counts indexed by outcome.
+    """
+
+    rolls, faces, dice, seedSequence = args
+    return roll_counts(rolls, faces, dice, seedSequence)
+
+
+def parallel_roll_counts(rolls, faces=6, dice=1, seed=None, workers=None, blockRolls=1 << 24):
+    """
+    Count the outcomes of many dice rolls split across a process pool.
+
+    The rolls are cut into blocks of blockRolls, and block i draws from the i-th child of
+    SeedSequence(seed).spawn. The blocks do not depend on the number of workers, so a given seed gives the
+    same counts whether they run on one process or many. Workers return count arrays that are summed here.
+
+    Args:
+    rolls (int): Number of rolls.
+    faces (int): Number of faces of each die.
+    dice (int): Number of dice thrown per roll.
+    seed (int or SeedSequence): Root seed (None for fresh entropy).
+    workers (int): Number of worker processes (None or 1 to count in this process).
+    blockRolls (int): Number of rolls per block.
+
+    Returns:
+    numpy.ndarray: Counts indexed by outcome, from 0 to dice*faces.
+    """
+
+    seedSequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    blocks = [(min(blockRolls, rolls - start), faces, dice, child)
+              for start, child in zip(range(0, rolls, blockRolls),
+                                      seedSequence.spawn(-(-rolls // blockRolls)))]
+    counts = np.zeros(dice * faces + 1, dtype=np.int64)
+
+    if workers and workers > 1 and len(blocks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for blockCounts in executor.map(_block_counts, blocks):
+                counts += blockCounts
+    else:
+        for block in blocks:
+            counts += _block_counts(block)
+    return counts
+
+
+def outcome_probabilities(faces=6, dice=1):
+    """
+    Compute the probability of each outcome of a roll of fair dice.
+
+    Args:
+    faces (int): Number of faces of each die.
+    dice (int): Number of dice thrown per roll.
+
+    Returns:
+    numpy.ndarray: Probabilities indexed by outcome, from 0 to dice*faces.
+    """
+
+    # One die is uniform over 1..faces; the sum of several is the repeated convolution.
+    single = np.full(faces + 1, 1 / faces)
+    single[0] = 0
+    probabilities = np.array([1.0])
+    for _ in range(dice):
+        probabilities = np.convolve(probabilities, single)
+    return probabilities
+
+
+def chi_square(counts, faces=6, dice=1):
+    """
+    Compute Pearson's chi-square statistic of observed counts against fair dice.
+
+    The p-value uses the Wilson-Hilferty normal approximation of the chi-square distribution, which is
+    accurate to about three decimals for the degrees of freedom of common dice.
+
+    Args:
+    counts (numpy.ndarray): Counts indexed by outcome, as returned by roll_counts.
+    faces (int): Number of faces of each die.
+    dice (int): Number of dice thrown per roll.
+
+    Returns:
+    tuple: (statistic, degreesOfFreedom, pValue)
+    """
+
+    probabilities = outcome_probabilities(faces, dice)
+    possible = probabilities > 0
+    expected = counts.sum() * probabilities[possible]
+    statistic = float((((counts[possible] - expected) ** 2) / expected).sum())
+    degreesOfFreedom = int(possible.sum()) - 1
+    if degreesOfFreedom == 0:
+        return statistic, 0, 1.0
+    # Wilson-Hilferty: (statistic/dof)^(1/3) is close to normal.
+    scale = 2 / (9 * degreesOfFreedom)
+    z = ((statistic / degreesOfFreedom) ** (1 / 3) - (1 - scale)) / math.sqrt(scale)
+    return statistic, degreesOfFreedom, 0.5 * math.erfc(z / math.sqrt(2))
+
+
 def main():
     """
     Main function that serves as the entry point when script is run.
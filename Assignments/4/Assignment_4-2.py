@@ -1,3 +1,8 @@
+import random
+import time
+import queue
+import asyncio
+import threading
 from collections import deque
 
 
@@ -43,6 +48,534 @@ def manipulate_deque():
     print(movieStars)
 
 
+class _Block:
+    """
+    A run of consecutive roster entries.
+
+    Attributes:
+    items (list): The entries of the block, in order.
+    position (int): Index of the block in the roster's block list, refreshed when blocks are added or dropped.
+    """
+
+    __slots__ = ("items", "position")
+
+    def __init__(self, items, position=0):
+        self.items = items
+        self.position = position
+
+
+class Roster:
+    """
+    Double-ended sequence of names with fast positional insert and removal by value.
+
+    Entries are stored in blocks of at most 2*blockSize items. A Fenwick tree over the block sizes finds
+    the block holding any position in O(log b) steps for b blocks, and a hash index maps each value to the
+    blocks containing it, so remove(value) goes straight to the right block. Inside a block, inserts and
+    removals shift at most 2*blockSize items. appendleft/append/popleft/pop behave as on collections.deque.
+
+    Args:
+    iterable (iterable): Initial entries.
+    blockSize (int): Target number of entries per block.
+    """
+
+    def __init__(self, iterable=(), blockSize=512):
+        self.blockSize = blockSize
+        self.blocks = []
+        self.index = {}
+        self.size = 0
+        self._tree = []
+        self._dirty = False
+        items = list(iterable)
+        for start in range(0, len(items), blockSize):
+            self._add_block(len(self.blocks), items[start:start + blockSize])
+        self.size = len(items)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for block in self.blocks:
+            yield from block.items
+
+    def __contains__(self, value):
+        return value in self.index
+
+    def __repr__(self):
+        return f"Roster({list(self)!r})"
+
+    def __getitem__(self, position):
+        block, offset = self._locate(position)
+        return block.items[offset]
+
+    def _add_block(self, blockIdx, items):
+        """
+        Insert a new block into the block list and index its entries.
+        """
+
+        block = _Block(items, blockIdx)
+        self.blocks.insert(blockIdx, block)
+        for value in items:
+            self.index.setdefault(value, set()).add(block)
+        self._dirty = True
+        return block
+
+    def _unindex(self, value, block):
+        """
+        Drop block from the index entry of value if it no longer holds that value.
+        """
+
+        if value not in block.items:
+            blocks = self.index[value]
+            blocks.discard(block)
+            if not blocks:
+                del self.index[value]
+
+    def _rebuild(self):
+        """
+        Refresh the block positions and rebuild the Fenwick tree of block sizes in O(b).
+        """
+
+        tree = [0] * (len(self.blocks) + 1)
+        for blockIdx, block in enumerate(self.blocks):
+            block.position = blockIdx
+            tree[blockIdx + 1] += len(block.items)
+            parent = blockIdx + 1 + ((blockIdx + 1) & -(blockIdx + 1))
+            if parent <= len(self.blocks):
+                tree[parent] += tree[blockIdx + 1]
+        self._tree = tree
+        self._dirty = False
+
+    def _resize(self, block, delta):
+        """
+        Record that block grew or shrank by delta entries.
+        """
+
+        self.size += delta
+        if self._dirty:
+            return
+        node = block.position + 1
+        while node < len(self._tree):
+            self._tree[node] += delta
+            node += node & -node
+
+    def _locate(self, position):
+        """
+        Find the block holding an entry and the offset of the entry within it.
+
+        Args:
+        position (int): Index of the entry; negative values count from the end.
+
+        Returns:
+        tuple: (block, offset)
+        """
+
+        if position < 0:
+            position += self.size
+        if not 0 <= position < self.size:
+            raise IndexError("Roster index out of range")
+        if self._dirty:
+            self._rebuild()
+        # Descend the Fenwick tree to the last block whose prefix size is at most position.
+        node, step = 0, 1 << (len(self.blocks).bit_length())
+        while step:
+            if node + step < len(self._tree) and self._tree[node + step] <= position:
+                node += step
+                position -= self._tree[node]
+            step >>= 1
+        return self.blocks[node], position
+
+    def _drop_if_empty(self, block):
+        """
+        Remove a block from the block list once its last entry is gone.
+        """
+
+        if not block.items:
+            if self._dirty:
+                self._rebuild()
+            del self.blocks[block.position]
+            self._dirty = True
+
+    def _split_if_full(self, block):
+        """
+        Split a block in two halves once it holds more than 2*blockSize entries.
+        """
+
+        if len(block.items) <= 2 * self.blockSize:
+            return
+        if self._dirty:
+            self._rebuild()
+        half = len(block.items) // 2
+        moved = block.items[half:]
+        del block.items[half:]
+        newBlock = self._add_block(block.position + 1, moved)
+        # Values that only lived in the moved half no longer point at the old block.
+        remaining = set(block.items)
+        for value in set(moved) - remaining:
+            self.index[value].discard(block)
+        newBlock.position = block.position + 1
+
+    def append(self, value):
+        """
+        Add an entry at the rear.
+        """
+
+        if not self.blocks:
+            self._add_block(0, [])
+        block = self.blocks[-1]
+        block.items.append(value)
+        self.index.setdefault(value, set()).add(block)
+        self._resize(block, 1)
+        self._split_if_full(block)
+
+    def appendleft(self, value):
+        """
+        Add an entry at the front.
+        """
+
+        if not self.blocks:
+            self._add_block(0, [])
+        block = self.blocks[0]
+        block.items.insert(0, value)
+        self.index.setdefault(value, set()).add(block)
+        self._resize(block, 1)
+        self._split_if_full(block)
+
+    def pop(self):
+        """
+        Remove and return the entry at the rear.
+        """
+
+        if not self.size:
+            raise IndexError("pop from an empty Roster")
+        block = self.blocks[-1]
+        value = block.items.pop()
+        self._unindex(value, block)
+        self._resize(block, -1)
+        self._drop_if_empty(block)
+        return value
+
+    def popleft(self):
+        """
+        Remove and return the entry at the front.
+        """
+
+        if not self.size:
+            raise IndexError("pop from an empty Roster")
+        block = self.blocks[0]
+        value = block.items.pop(0)
+        self._unindex(value, block)
+        self._resize(block, -1)
+        self._drop_if_empty(block)
+        return value
+
+    def insert(self, position, value):
+        """
+        Insert an entry before position, like deque.insert (positions past the end append).
+        """
+
+        if position < 0:
+            position = max(0, position + self.size)
+        if position >= self.size:
+            self.append(value)
+            return
+        block, offset = self._locate(position)
+        block.items.insert(offset, value)
+        self.index.setdefault(value, set()).add(block)
+        self._resize(block, 1)
+        self._split_if_full(block)
+
+    def remove(self, value):
+        """
+        Remove the first occurrence of value, like deque.remove (ValueError if it is absent).
+        """
+
+        blocks = self.index.get(value)
+        if not blocks:
+            raise ValueError(f"{value!r} is not in Roster")
+        if self._dirty:
+            self._rebuild()
+        # With duplicates, the first occurrence is in the earliest block holding the value.
+        block = min(blocks, key=lambda candidate: candidate.position)
+        block.items.remove(value)
+        self._unindex(value, block)
+        self._resize(block, -1)
+        self._drop_if_empty(block)
+
+
+class WorkQueue:
+    """
+    Bounded, thread-safe double-ended queue for producer and consumer threads.
+
+    Items can be pushed and popped at both ends, blocking until there is room or an item, optionally with
+    a timeout. push_many and pop_many move whole batches under a single lock acquisition and wake waiting
+    threads once per batch, so adding producers that push in batches adds throughput instead of contention.
+    Like queue.Queue, a full or empty queue raises queue.Full or queue.Empty when not blocking or when the
+    timeout expires.
+
+    Args:
+    maxsize (int): Maximum number of items (0 for no limit).
+    storage (type): Container class with deque methods, for example collections.deque or Roster.
+    """
+
+    def __init__(self, maxsize=0, storage=deque):
+        self.maxsize = maxsize
+        self.items = storage()
+        self.lock = threading.Lock()
+        self.notEmpty = threading.Condition(self.lock)
+        self.notFull = threading.Condition(self.lock)
+
+    def __len__(self):
+        with self.lock:
+            return len(self.items)
+
+    def _room(self):
+        """
+        Number of items that fit right now; call with the lock held.
+        """
+
+        return self.maxsize - len(self.items) if self.maxsize > 0 else float("inf")
+
+    def _wait(self, condition, ready, block, deadline, error):
+        """
+        Wait on condition until ready() is true; call with the lock held.
+        """
+
+        while not ready():
+            if not block:
+                raise error
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise error
+            condition.wait(remaining)
+
+    def push(self, item, block=True, timeout=None):
+        """
+        Add an item at the rear, waiting for room if the queue is full.
+        """
+
+        self.push_many([item], block=block, timeout=timeout, left=False, partial=False)
+
+    def push_left(self, item, block=True, timeout=None):
+        """
+        Add an item at the front, waiting for room if the queue is full.
+        """
+
+        self.push_many([item], block=block, timeout=timeout, left=True, partial=False)
+
+    def pop(self, block=True, timeout=None):
+        """
+        Remove and return the item at the rear, waiting for one if the queue is empty.
+        """
+
+        return self.pop_many(1, block=block, timeout=timeout, left=False)[0]
+
+    def pop_left(self, block=True, timeout=None):
+        """
+        Remove and return the item at the front, waiting for one if the queue is empty.
+        """
+
+        return self.pop_many(1, block=block, timeout=timeout, left=True)[0]
+
+    def push_many(self, items, block=True, timeout=None, left=False, partial=True):
+        """
+        Add a batch of items at one end, in order, waiting for room as needed.
+
+        Args:
+        items (iterable): Items to add; with left=True each one goes in front of the previous one, as with
+            deque.extendleft.
+        block (bool): Wait for room when the queue is full.
+        timeout (float): Maximum time to wait in seconds (None for no limit).
+        left (bool): Add at the front instead of the rear.
+        partial (bool): On timeout, return the number of items added instead of raising queue.Full
+            (queue.Full is still raised if none could be added).
+
+        Returns:
+        int: Number of items added.
+        """
+
+        items = list(items)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        add = self.items.appendleft if left else self.items.append
+        pushed = 0
+        with self.lock:
+            while pushed < len(items):
+                try:
+                    self._wait(self.notFull, lambda: self._room() > 0, block, deadline, queue.Full)
+                except queue.Full:
+                    if partial and pushed:
+                        return pushed
+                    raise
+                # Add as many items as fit, then wake the consumers that can take them.
+                batch = items[pushed:pushed + int(min(self._room(), len(items) - pushed))]
+                for item in batch:
+                    add(item)
+                pushed += len(batch)
+                self.notEmpty.notify(len(batch))
+        return pushed
+
+    def pop_many(self, maxItems, block=True, timeout=None, left=False):
+        """
+        Remove up to maxItems items from one end, waiting only until at least one is available.
+
+        Args:
+        maxItems (int): Maximum number of items to remove.
+        block (bool): Wait for an item when the queue is empty.
+        timeout (float): Maximum time to wait in seconds (None for no limit).
+        left (bool): Remove from the front instead of the rear.
+
+        Returns:
+        list: The removed items, in the order they were removed.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.lock:
+            self._wait(self.notEmpty, lambda: len(self.items) > 0, block, deadline, queue.Empty)
+            take = self.items.popleft if left else self.items.pop
+            batch = [take() for _ in range(min(maxItems, len(self.items)))]
+            # Wake the producers that can fill the freed room.
+            self.notFull.notify(len(batch))
+        return batch
+
+
+class AsyncWorkQueue:
+    """
+    Bounded double-ended queue for asyncio tasks, with the same operations as WorkQueue as coroutines.
+
+    A full or empty queue raises asyncio.QueueFull or asyncio.QueueEmpty when not blocking or when the
+    timeout expires.
+
+    Args:
+    maxsize (int): Maximum number of items (0 for no limit).
+    storage (type): Container class with deque methods, for example collections.deque or Roster.
+    """
+
+    def __init__(self, maxsize=0, storage=deque):
+        self.maxsize = maxsize
+        self.items = storage()
+        self.condition = asyncio.Condition()
+
+    def __len__(self):
+        return len(self.items)
+
+    def _room(self):
+        """
+        Number of items that fit right now; call with the condition's lock held.
+        """
+
+        return self.maxsize - len(self.items) if self.maxsize > 0 else float("inf")
+
+    async def _wait(self, ready, block, deadline, error):
+        """
+        Wait until ready() is true; call with the condition's lock held.
+        """
+
+        while not ready():
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if not block or (remaining is not None and remaining <= 0):
+                raise error
+            try:
+                await asyncio.wait_for(self.condition.wait(), remaining)
+            except asyncio.TimeoutError:
+                raise error from None
+
+    async def push(self, item, block=True, timeout=None):
+        """
+        Add an item at the rear, waiting for room if the queue is full.
+        """
+
+        await self.push_many([item], block=block, timeout=timeout, left=False, partial=False)
+
+    async def push_left(self, item, block=True, timeout=None):
+        """
+        Add an item at the front, waiting for room if the queue is full.
+        """
+
+        await self.push_many([item], block=block, timeout=timeout, left=True, partial=False)
+
+    async def pop(self, block=True, timeout=None):
+        """
+        Remove and return the item at the rear, waiting for one if the queue is empty.
+        """
+
+        return (await self.pop_many(1, block=block, timeout=timeout, left=False))[0]
+
+    async def pop_left(self, block=True, timeout=None):
+        """
+        Remove and return the item at the front, waiting for one if the queue is empty.
+        """
+
+        return (await self.pop_many(1, block=block, timeout=timeout, left=True))[0]
+
+    async def push_many(self, items, block=True, timeout=None, left=False, partial=True):
+        """
+        Add a batch of items at one end; see WorkQueue.push_many.
+        """
+
+        items = list(items)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pushed = 0
+        async with self.condition:
+            add = self.items.appendleft if left else self.items.append
+            while pushed < len(items):
+                try:
+                    await self._wait(lambda: self._room() > 0, block, deadline, asyncio.QueueFull)
+                except asyncio.QueueFull:
+                    if partial and pushed:
+                        return pushed
+                    raise
+                batch = items[pushed:pushed + int(min(self._room(), len(items) - pushed))]
+                for item in batch:
+                    add(item)
+                pushed += len(batch)
+                self.condition.notify_all()
+        return pushed
+
+    async def pop_many(self, maxItems, block=True, timeout=None, left=False):
+        """
+        Remove up to maxItems items from one end; see WorkQueue.pop_many.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        async with self.condition:
+            await self._wait(lambda: len(self.items) > 0, block, deadline, asyncio.QueueEmpty)
+            take = self.items.popleft if left else self.items.pop
+            batch = [take() for _ in range(min(maxItems, len(self.items)))]
+            self.condition.notify_all()
+        return batch
+
+
+def benchmark_roster(sizes=(1000, 10000, 100000, 1000000), operations=200, seed=0):
+    """
+    Time middle inserts and removals by value on a Roster and on a collections.deque.
+
+    For each size, both structures start with the same names; then each operation inserts a new name in
+    the middle and removes a random existing name.
+
+    Args:
+    sizes (tuple): Numbers of entries to benchmark.
+    operations (int): Number of insert/remove pairs per size.
+    seed (int): Seed of the names removed.
+
+    Returns:
+    list: (size, dequeSeconds, rosterSeconds) tuples.
+    """
+
+    results = []
+    for size in sizes:
+        names = [f"Name {idx}" for idx in range(size)]
+        removals = random.Random(seed).sample(names, operations)
+        timings = []
+        for structure in (deque(names), Roster(names)):
+            start = time.perf_counter()
+            for idx, name in enumerate(removals):
+                structure.insert(len(structure) // 2, f"New {idx}")
+                structure.remove(name)
+            timings.append(time.perf_counter() - start)
+        results.append((size, timings[0], timings[1]))
+        print(f"{size:>9} entries: deque {timings[0]:.4f}s, Roster {timings[1]:.4f}s")
+    return results
+
+
 def main():
     """
     Main function that drives the script.
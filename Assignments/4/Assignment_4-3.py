@@ -1,19 +1,318 @@
 import math
+import itertools
+import numpy as np
 
 
-def celsius_to_fahrenheit(celsius):
+def celsius_to_fahrenheit(celsius, out=None):
     """
     Convert a temperature from Celsius to Fahrenheit.
 
+    NumPy arrays are converted as a whole with the same operations in the same order as a single value,
+    so every element matches the scalar result; the result is written into out when it is given.
+
     Args:
-    celsius (float): Temperature in Celsius.
+    celsius (float or numpy.ndarray): Temperature(s) in Celsius.
+    out (numpy.ndarray): Optional float buffer of the same shape for the result (may be celsius itself).
 
     Returns:
-    float: Temperature converted to Fahrenheit.
+    float or numpy.ndarray: Temperature(s) converted to Fahrenheit.
     """
+    if isinstance(celsius, np.ndarray) or out is not None:
+        if out is None:
+            out = np.empty(np.shape(celsius), dtype=np.float64)
+        np.multiply(celsius, 9, out=out)
+        np.divide(out, 5, out=out)
+        return np.add(out, 32, out=out)
     return (celsius * 9/5) + 32
 
 
+def sine_values(degrees, decimals=1, out=None):
+    """
+    Compute the sine of angles given in degrees, rounded to a number of decimals.
+
+    Args:
+    degrees (float, list or numpy.ndarray): Angle(s) in degrees.
+    decimals (int): Number of decimals to round to.
+    out (numpy.ndarray): Optional float buffer for the result of an array input (may be degrees itself).
+
+    Returns:
+    float, list or numpy.ndarray: The rounded sine value(s), in the type of the input.
+    """
+    if isinstance(degrees, np.ndarray) or out is not None:
+        if out is None:
+            out = np.empty(np.shape(degrees), dtype=np.float64)
+        # Each stage writes into the same buffer instead of a new temporary.
+        np.radians(degrees, out=out)
+        np.sin(out, out=out)
+        return np.round(out, decimals, out=out)
+    if isinstance(degrees, list):
+        return [round(math.sin(math.radians(x)), decimals) for x in degrees]
+    return round(math.sin(math.radians(degrees)), decimals)
+
+
+def non_negative_values(values):
+    """
+    Keep only the non-negative values.
+
+    Args:
+    values (list or numpy.ndarray): The values to filter.
+
+    Returns:
+    list or numpy.ndarray: The non-negative values, in order, in the type of the input.
+    """
+    if isinstance(values, np.ndarray):
+        return values[values >= 0]
+    return [x for x in values if x >= 0]
+
+
+def temperatures_and_sines(celsius, fahrenheitOut=None, sineOut=None, table=None):
+    """
+    Run the three stages of calculate_temperatures_and_sines on an array of Celsius readings.
+
+    Args:
+    celsius (array-like): Temperatures in Celsius.
+    fahrenheitOut (numpy.ndarray): Optional float buffer for the Fahrenheit temperatures.
+    sineOut (numpy.ndarray): Optional float buffer for the sine values.
+    table (DegreeTable): Optional lookup table for whole-degree readings (the buffers are then unused).
+
+    Returns:
+    tuple: (fahrenheit, sines, nonNegativeSines) arrays.
+    """
+    celsius = np.asarray(celsius)
+    if table is not None:
+        sines = table.sine(celsius)
+        return table.fahrenheit(celsius), sines, non_negative_values(sines)
+    fahrenheit = celsius_to_fahrenheit(celsius, out=fahrenheitOut)
+    sines = sine_values(celsius, out=sineOut)
+    return fahrenheit, sines, non_negative_values(sines)
+
+
+def is_non_negative(value):
+    """
+    Test whether a value is non-negative; on an array, returns the element-wise mask.
+
+    Args:
+    value (float or numpy.ndarray): The value(s) to test.
+
+    Returns:
+    bool or numpy.ndarray: True where the value is greater than or equal to zero.
+    """
+    return value >= 0
+
+
+class DegreeTable:
+    """
+    Precomputed Fahrenheit temperatures and rounded sines for whole degrees in a fixed range.
+
+    The tables are filled once with celsius_to_fahrenheit and sine_values on each integer, so a lookup
+    gives exactly what the functions would return. Whole-degree readings inside the range are answered by
+    an index (or a gather for arrays); any other reading falls back to the exact computation.
+
+    Args:
+    low (int): Lowest whole degree in the table.
+    high (int): Highest whole degree in the table.
+    decimals (int): Number of decimals of the rounded sines.
+    """
+
+    def __init__(self, low=-273, high=1000, decimals=1):
+        self.low = low
+        self.high = high
+        self.decimals = decimals
+        degrees = range(low, high + 1)
+        # Fill the tables from the scalar functions so that lookups match them exactly.
+        self.fahrenheitTable = np.array([celsius_to_fahrenheit(x) for x in degrees])
+        self.sineTable = np.array([sine_values(x, decimals) for x in degrees])
+        # Dictionaries answer single values; 20.0 finds the entry of 20 since equal numbers hash alike.
+        self.fahrenheitLookup = dict(zip(degrees, self.fahrenheitTable.tolist()))
+        self.sineLookup = dict(zip(degrees, self.sineTable.tolist()))
+
+    def _lookup(self, values, table, lookup, exact):
+        """
+        Answer values from a table where possible and with the exact function elsewhere.
+        """
+        if isinstance(values, np.ndarray):
+            if values.dtype.kind in "iu" and values.size:
+                # Integer readings that all fit in the table need a single gather.
+                offsets = values - self.low
+                if offsets.min() >= 0 and offsets.max() < len(table):
+                    return table.take(offsets)
+            # Otherwise whole degrees inside the range are gathered and the rest computed exactly.
+            inTable = (values >= self.low) & (values <= self.high)
+            if values.dtype.kind == "f":
+                inTable &= values == np.floor(values)
+            result = np.empty(values.shape, dtype=np.float64)
+            result[inTable] = table[(values[inTable] - self.low).astype(np.intp)]
+            if not inTable.all():
+                result[~inTable] = exact(values[~inTable].astype(np.float64))
+            return result
+        if isinstance(values, list):
+            # Look every value up in one pass, then compute the few that missed.
+            results = list(map(lookup.get, values))
+            for idx, result in enumerate(results):
+                if result is None:
+                    results[idx] = exact(values[idx])
+            return results
+        result = lookup.get(values)
+        return exact(values) if result is None else result
+
+    def fahrenheit(self, celsius):
+        """
+        Convert Celsius temperature(s) to Fahrenheit, like celsius_to_fahrenheit.
+
+        Args:
+        celsius (float, list or numpy.ndarray): Temperature(s) in Celsius.
+
+        Returns:
+        float, list or numpy.ndarray: Temperature(s) in Fahrenheit, in the type of the input.
+        """
+        return self._lookup(celsius, self.fahrenheitTable, self.fahrenheitLookup, celsius_to_fahrenheit)
+
+    def sine(self, degrees):
+        """
+        Compute rounded sine value(s) of angles in degrees, like sine_values.
+
+        Args:
+        degrees (float, list or numpy.ndarray): Angle(s) in degrees.
+
+        Returns:
+        float, list or numpy.ndarray: The rounded sine value(s), in the type of the input.
+        """
+        return self._lookup(degrees, self.sineTable, self.sineLookup, lambda x: sine_values(x, self.decimals))
+
+
+class Pipeline:
+    """
+    Lazy chain of map and filter stages over a source of values.
+
+    Stages are only recorded until a sink (iteration, to_list, to_array or count) pulls values; each
+    value then flows through every stage before the next one is read, so no stage is materialized.
+    When the source is a NumPy array and every stage is marked vectorize=True, the stages are fused
+    into one kernel that runs on chunks of the array instead of element by element.
+
+    Example: Pipeline(readings).map(celsius_to_fahrenheit, vectorize=True).to_array()
+
+    Args:
+    source (iterable or numpy.ndarray): The values to process.
+    chunkSize (int): Number of array elements processed per kernel call.
+    """
+
+    def __init__(self, source, chunkSize=1 << 16, stages=()):
+        self.source = source
+        self.chunkSize = chunkSize
+        self.stages = tuple(stages)
+
+    def _with(self, stage):
+        """
+        Return a new pipeline with one more stage; pipelines are immutable, so they can be reused.
+        """
+        return Pipeline(self.source, self.chunkSize, self.stages + (stage,))
+
+    def map(self, func, vectorize=False):
+        """
+        Add a stage that transforms each value.
+
+        Args:
+        func (callable): Function of one value.
+        vectorize (bool): func also accepts a NumPy array and works element-wise on it.
+
+        Returns:
+        Pipeline: The extended pipeline.
+        """
+        return self._with(("map", func, vectorize))
+
+    def filter(self, predicate, vectorize=False):
+        """
+        Add a stage that keeps the values for which predicate is true.
+
+        Args:
+        predicate (callable): Function of one value returning a bool.
+        vectorize (bool): predicate also accepts a NumPy array and returns a boolean mask.
+
+        Returns:
+        Pipeline: The extended pipeline.
+        """
+        return self._with(("filter", predicate, vectorize))
+
+    def is_fused(self):
+        """
+        Tell whether the pipeline runs as a fused array kernel.
+
+        Returns:
+        bool: True for an array source with only vectorized stages.
+        """
+        return isinstance(self.source, np.ndarray) and all(vectorize for _, _, vectorize in self.stages)
+
+    def _kernel(self, chunk):
+        """
+        Apply every stage to one chunk of the source array.
+        """
+        for kind, func, _ in self.stages:
+            chunk = func(chunk) if kind == "map" else chunk[func(chunk)]
+        return chunk
+
+    def chunks(self):
+        """
+        Yield the results of the fused kernel chunk by chunk (only for fused pipelines).
+
+        Returns:
+        generator: NumPy arrays.
+        """
+        values = self.source.ravel()
+        for start in range(0, len(values), self.chunkSize):
+            yield self._kernel(values[start:start + self.chunkSize])
+
+    def _python_values(self):
+        """
+        Yield the elements of an array source as Python scalars, converting one chunk at a time.
+
+        Returns:
+        generator: Python scalars.
+        """
+        values = self.source.ravel()
+        for start in range(0, len(values), self.chunkSize):
+            yield from values[start:start + self.chunkSize].tolist()
+
+    def __iter__(self):
+        if self.is_fused():
+            for chunk in self.chunks():
+                yield from chunk.tolist()
+            return
+        # Chain one lazy map or filter per stage; nothing runs until the chain is consumed.
+        values = self._python_values() if isinstance(self.source, np.ndarray) else iter(self.source)
+        for kind, func, _ in self.stages:
+            values = map(func, values) if kind == "map" else filter(func, values)
+        yield from values
+
+    def to_list(self):
+        """
+        Run the pipeline into a list.
+        """
+        return list(self)
+
+    def to_array(self, dtype=np.float64):
+        """
+        Run the pipeline into a NumPy array.
+        """
+        if self.is_fused():
+            return np.concatenate([np.asarray(chunk, dtype=dtype) for chunk in self.chunks()] or
+                                  [np.empty(0, dtype=dtype)])
+        return np.fromiter(iter(self), dtype=dtype)
+
+    def count(self):
+        """
+        Run the pipeline and count the values it produces, without keeping them.
+        """
+        if self.is_fused():
+            return sum(len(chunk) for chunk in self.chunks())
+        return sum(1 for _ in self)
+
+    def take(self, count):
+        """
+        Run the pipeline only far enough to produce the first count values.
+        """
+        return list(itertools.islice(self, count))
+
+
 def calculate_temperatures_and_sines():
     """
     Calculate Fahrenheit temperatures and sine values for a list of Celsius temperatures.
@@ -1,7 +1,18 @@
 import unittest
 import math
 import random
+import importlib
+import itertools
+import queue
+import asyncio
+import threading
 from collections import deque, Counter
+import numpy as np
+
+# The assignment modules have hyphenated names, so they are imported by name.
+dieRollsModule = importlib.import_module("Assignment_4-1")
+dequeModule = importlib.import_module("Assignment_4-2")
+temperatureModule = importlib.import_module("Assignment_4-3")
 
 
 def simulate_die_rolls():
@@ -166,6 +177,168 @@ class TestFunctions(unittest.TestCase):
         # Ensure all sine values are non-negative
         self.assertTrue(all(sine >= 0 for sine in nonNegativeSines))
 
+    def test_roll_counts(self):
+        # Every roll is counted once, and only outcomes a die can show are counted.
+        counts = dieRollsModule.roll_counts(10000, seed=7, chunkSize=999)
+        self.assertEqual(counts.sum(), 10000)
+        self.assertEqual(counts[0], 0)
+        self.assertTrue(all(counts[1:] > 0))
+        # The same seed gives the same counts.
+        self.assertTrue((dieRollsModule.roll_counts(10000, seed=7, chunkSize=999) == counts).all())
+
+        # Two dice give sums from 2 to 12, with 7 the most common.
+        counts = dieRollsModule.roll_counts(60000, faces=6, dice=2, seed=7)
+        self.assertEqual(len(counts), 13)
+        self.assertEqual(counts[:2].sum(), 0)
+        self.assertEqual(counts.argmax(), 7)
+
+    def test_simulate_die_rolls_numpy(self):
+        mostCommon = dieRollsModule.simulate_die_rolls_numpy(100, seed=3, verbose=False)
+        counts = dieRollsModule.roll_counts(100, seed=3)
+        # The result has the format of Counter.most_common(3).
+        self.assertEqual(len(mostCommon), 3)
+        self.assertEqual([count for _, count in mostCommon], sorted(counts, reverse=True)[:3])
+        self.assertTrue(all(1 <= number <= 6 for number, _ in mostCommon))
+
+    def test_parallel_roll_counts(self):
+        # The counts depend on the seed only, not on the number of workers.
+        serial = dieRollsModule.parallel_roll_counts(50000, seed=11, blockRolls=10000)
+        parallel = dieRollsModule.parallel_roll_counts(50000, seed=11, workers=2, blockRolls=10000)
+        self.assertTrue((serial == parallel).all())
+        self.assertEqual(serial.sum(), 50000)
+
+    def test_chi_square(self):
+        # Counts exactly proportional to the probabilities of two dice give a zero statistic.
+        counts = (dieRollsModule.outcome_probabilities(6, 2) * 36000).round().astype(int)
+        statistic, degreesOfFreedom, pValue = dieRollsModule.chi_square(counts, 6, 2)
+        self.assertAlmostEqual(statistic, 0.0)
+        self.assertEqual(degreesOfFreedom, 10)
+        self.assertAlmostEqual(pValue, 1.0)
+
+        # A heavily loaded die is rejected.
+        counts = [0, 100, 100, 100, 100, 100, 400]
+        self.assertLess(dieRollsModule.chi_square(np.array(counts))[2], 1e-6)
+
+    def test_roster_matches_deque(self):
+        # Apply the same random operations to a deque and to a Roster with tiny blocks.
+        rng = random.Random(5)
+        movieStars = deque(["Robert Lopez", "John Legend", "Andrew Lloyd Webber", "Tim Rice", "Alan Menken"])
+        roster = dequeModule.Roster(movieStars, blockSize=2)
+        for step in range(2000):
+            operation = rng.randrange(6)
+            name = f"Star {rng.randrange(15)}"
+            if operation == 0:
+                movieStars.append(name)
+                roster.append(name)
+            elif operation == 1:
+                movieStars.appendleft(name)
+                roster.appendleft(name)
+            elif operation == 2 and movieStars:
+                self.assertEqual(movieStars.pop(), roster.pop())
+            elif operation == 3 and movieStars:
+                self.assertEqual(movieStars.popleft(), roster.popleft())
+            elif operation == 4:
+                middleInsert = len(movieStars) // 2
+                movieStars.insert(middleInsert, name)
+                roster.insert(middleInsert, name)
+            elif name in movieStars:
+                movieStars.remove(name)
+                roster.remove(name)
+            self.assertEqual(list(movieStars), list(roster))
+        self.assertEqual(movieStars[len(movieStars) // 2], roster[len(roster) // 2])
+        self.assertRaises(ValueError, roster.remove, "Nobody")
+
+    def test_work_queue(self):
+        # Several producer threads push batches into a small queue drained from both ends.
+        workQueue = dequeModule.WorkQueue(maxsize=8)
+        received = []
+        producers = [threading.Thread(target=workQueue.push_many, args=([(p, i) for i in range(200)],))
+                     for p in range(3)]
+        for producer in producers:
+            producer.start()
+        while len(received) < 600:
+            received.extend(workQueue.pop_many(5, timeout=5, left=len(received) % 2 == 0))
+        for producer in producers:
+            producer.join()
+        self.assertEqual(sorted(received), sorted((p, i) for p in range(3) for i in range(200)))
+
+        # Full and empty queues time out with the queue module's exceptions.
+        workQueue.push_many(range(8))
+        self.assertRaises(queue.Full, workQueue.push_left, "late", timeout=0.01)
+        self.assertEqual(workQueue.pop_many(100), list(range(7, -1, -1)))
+        self.assertRaises(queue.Empty, workQueue.pop, block=False)
+
+    def test_async_work_queue(self):
+        async def run():
+            workQueue = dequeModule.AsyncWorkQueue(maxsize=3)
+            producer = asyncio.ensure_future(workQueue.push_many(range(10)))
+            received = []
+            while len(received) < 10:
+                received.extend(await workQueue.pop_many(4, left=True))
+            await producer
+            with self.assertRaises(asyncio.QueueEmpty):
+                await workQueue.pop(timeout=0.01)
+            return received
+
+        self.assertEqual(asyncio.run(run()), list(range(10)))
+
+    def test_vectorized_temperatures_and_sines(self):
+        celsiusTemperatures = [-40, -30, -20, -10, 0, 10, 20, 30, 40, 50]
+        fahrenheit, sines, nonNegativeSines = temperatureModule.temperatures_and_sines(celsiusTemperatures)
+        # Arrays give exactly the values of the scalar functions.
+        self.assertEqual(fahrenheit.tolist(), list(map(celsius_to_fahrenheit, celsiusTemperatures)))
+        sineValues = list(map(lambda x: round(math.sin(math.radians(x)), 1), celsiusTemperatures))
+        self.assertEqual(sines.tolist(), sineValues)
+        self.assertEqual(nonNegativeSines.tolist(), list(filter(lambda x: x >= 0, sineValues)))
+
+        # Scalars keep their old behavior, and out= buffers are filled in place.
+        self.assertEqual(temperatureModule.celsius_to_fahrenheit(100), 212.0)
+        buffer = np.array(celsiusTemperatures, dtype=float)
+        self.assertIs(temperatureModule.celsius_to_fahrenheit(buffer, out=buffer), buffer)
+        self.assertEqual(buffer[-1], 122.0)
+
+    def test_pipeline(self):
+        celsiusTemperatures = [-40, -30, -20, -10, 0, 10, 20, 30, 40, 50]
+        sineValues = list(map(lambda x: round(math.sin(math.radians(x)), 1), celsiusTemperatures))
+        expected = list(filter(lambda x: x >= 0, sineValues))
+
+        # A streamed pipeline over a list, and the same stages fused over an array.
+        streamed = temperatureModule.Pipeline(celsiusTemperatures) \
+            .map(temperatureModule.sine_values).filter(temperatureModule.is_non_negative)
+        fused = temperatureModule.Pipeline(np.array(celsiusTemperatures), chunkSize=3) \
+            .map(temperatureModule.sine_values, vectorize=True) \
+            .filter(temperatureModule.is_non_negative, vectorize=True)
+        self.assertFalse(streamed.is_fused())
+        self.assertTrue(fused.is_fused())
+        self.assertEqual(streamed.to_list(), expected)
+        self.assertEqual(fused.to_list(), expected)
+        self.assertEqual(fused.count(), len(expected))
+
+        # Python stages over an array convert it chunk by chunk, across chunk boundaries.
+        chunked = temperatureModule.Pipeline(np.array(celsiusTemperatures), chunkSize=3) \
+            .map(temperatureModule.sine_values).filter(temperatureModule.is_non_negative)
+        self.assertFalse(chunked.is_fused())
+        self.assertEqual(chunked.to_list(), expected)
+
+        # Stages run lazily, so an endless source works as long as the sink stops.
+        endless = temperatureModule.Pipeline(itertools.count()).map(celsius_to_fahrenheit)
+        self.assertEqual(endless.take(2), [32.0, 33.8])
+
+    def test_degree_table(self):
+        table = temperatureModule.DegreeTable(-50, 50)
+        celsiusTemperatures = [-40, -30, -20, -10, 0, 10, 20, 30, 40, 50]
+        sineValues = list(map(lambda x: round(math.sin(math.radians(x)), 1), celsiusTemperatures))
+        # Whole degrees in the range come from the table and match the exact functions.
+        self.assertEqual(table.sine(celsiusTemperatures), sineValues)
+        self.assertEqual(table.fahrenheit(np.array(celsiusTemperatures)).tolist(),
+                         list(map(celsius_to_fahrenheit, celsiusTemperatures)))
+
+        # Fractional and out-of-range readings fall back to the exact computation.
+        readings = [36.6, 75, -60.0, 20.0]
+        self.assertEqual(table.fahrenheit(readings), list(map(celsius_to_fahrenheit, readings)))
+        self.assertEqual(table.sine(np.array(readings)).tolist(), temperatureModule.sine_values(readings))
+        self.assertEqual(table.sine(90), 1.0)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file